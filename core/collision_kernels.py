@@ -0,0 +1,29 @@
+"""
+Collision Kernels - Tight narrow-phase sweeps for the engine hot path
+Plain module-level functions working on hoisted locals, so the per-frame
+loops pay no method dispatch or repeated attribute reads
+"""
+
+
+def aabb_sweep(px, py, pw, ph, entities):
+    """
+    Return the entities whose AABB overlaps the player box.
+
+    Args:
+        px, py, pw, ph: Player bounding box (position + size)
+        entities: Iterable of objects with x, y, width, height
+
+    The player box is expanded into locals once; each entity then costs
+    four comparisons, instead of a check_collision call that re-reads
+    all eight attributes through a method frame.
+    """
+    px2 = px + pw
+    py2 = py + ph
+    hits = []
+    append = hits.append
+    for e in entities:
+        ex = e.x
+        ey = e.y
+        if px < ex + e.width and px2 > ex and py < ey + e.height and py2 > ey:
+            append(e)
+    return hits
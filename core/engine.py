@@ -1,550 +1,810 @@
-"""
-Game Engine - Main loop and game state management
-FIXED: Power-up collection logic (works like coins)
-ADDED: Save/Load system integration
-"""
-import time
-from enum import Enum
-from PySide6.QtCore import QTimer, QSize
-from PySide6.QtGui import QPainter, QColor
-
-from core.renderer import Renderer
-from core.physics import PhysicsEngine
-from core.input_manager import InputManager
-from game.level_manager import LevelManager
-from ui.hud import HUD
-from services.save_manager import SaveManager
-from run_sfx import SoundManager
-from game.particles import ParticleSystem
-from game.powerup import PowerUpManager
-
-
-class GameState(Enum):
-    """Game state enumeration."""
-    MENU = "menu"
-    RUNNING = "running"
-    PAUSED = "paused"
-    GAME_OVER = "game_over"
-    LEVEL_COMPLETE = "level_complete"
-
-
-class GameEngine:
-    """Main game engine coordinating all systems."""
-    
-    def __init__(self, widget):
-        self.widget = widget
-        self.state = GameState.MENU
-        
-        # Target 60 FPS
-        self.target_fps = 60
-        self.frame_time = 1000 // self.target_fps  # ~16ms
-        
-        # Delta time tracking
-        self.last_time = time.perf_counter()
-        self.delta_time = 0.0
-        self.accumulated_time = 0.0
-        
-        # Initialize systems
-        self.renderer = Renderer(widget.size())
-        self.physics = PhysicsEngine()
-        self.input = InputManager()
-        self.level_manager = LevelManager(self.physics)
-        self.hud = HUD()
-        self.save_manager = SaveManager()
-
-        # Sound Manager
-        self.sound = SoundManager("run_sound")
-        
-        # Particle System
-        self.particles = ParticleSystem()
-        
-        # Power-up Manager (initialized after player exists)
-        self.powerup_manager = None
-        
-        # Game state
-        self.score = 0
-        self.total_coins = 0
-        self.current_level = "level1"
-        
-        # Setup timer
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.tick)
-        
-        # Camera
-        self.camera_x = 0
-        self.camera_y = 0
-        
-        # Try to load saved game
-        self.has_save = self._check_save_exists()
-        
-    def _check_save_exists(self) -> bool:
-        """Check if save file exists."""
-        save_data = self.save_manager.load_game()
-        return bool(save_data)
-        
-    def start(self):
-        """Start the game engine."""
-        # Load level
-        self.level_manager.load_level(self.current_level)
-        
-        # Initialize power-up manager after player is created
-        if self.level_manager.player:
-            self.powerup_manager = PowerUpManager(self.level_manager.player)
-            
-        self.state = GameState.RUNNING
-        
-        # Play BGM automatically
-        self._play_bgm("run_bgm.mp3")
-        
-        # Start game loop
-        self.last_time = time.perf_counter()
-        self.timer.start(self.frame_time)
-        
-    def tick(self):
-        """Main game loop tick."""
-        # Calculate delta time
-        current_time = time.perf_counter()
-        self.delta_time = current_time - self.last_time
-        self.last_time = current_time
-        
-        # Clamp delta time to prevent spiral of death
-        if self.delta_time > 0.1:
-            self.delta_time = 0.1
-            
-        # Handle input regardless of state
-        self._handle_input()
-            
-        # Update based on state
-        if self.state == GameState.RUNNING:
-            self.update()
-        
-        # Always render (including menu)
-        self.widget.update()
-        
-    def update(self):
-        """Update game logic."""
-        # Update player
-        if self.level_manager.player:
-            self.level_manager.player.update(self.delta_time, self.input, self.sound)
-            
-        # Update physics
-        self.physics.update(self.delta_time, self.level_manager)
-
-        # Update power-ups (animation only)
-        for powerup in self.level_manager.powerups:
-            powerup.update(self.delta_time)
-
-        # Update power-up effects on player
-        if self.powerup_manager:
-            self.powerup_manager.update(self.delta_time)
-
-        # Update particle system
-        self.particles.update(self.delta_time)
-        
-        # Update enemies
-        for enemy in self.level_manager.enemies:
-            enemy.update(self.delta_time)
-            
-        # Check collisions
-        self._check_collisions()
-        
-        # Update camera
-        self._update_camera()
-        
-        # Check game over conditions
-        self._check_game_state()
-        
-    def render(self, event):
-        """Render game frame."""
-        painter = QPainter(self.widget)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        if self.state == GameState.MENU:
-            self.renderer.render_menu(painter, self.widget.size(), self.has_save)
-        elif self.state in [GameState.RUNNING, GameState.PAUSED]:
-            # Render game
-            self.renderer.render_background(painter, self.camera_x)
-            
-            # Render level with camera offset
-            self.level_manager.render(painter, self.camera_x, self.camera_y)
-
-            # Render particles (after level, before HUD)
-            self.particles.render(painter, self.camera_x, self.camera_y)
-            
-            # Render HUD
-            player = self.level_manager.player
-            if player:
-                self.hud.render(
-                    painter,
-                    score=self.score,
-                    coins=self.total_coins,
-                    health=player.health,
-                    distance=int(player.x / 48),
-                    level=self.current_level,
-                    power_up_effects=player.power_up_effects if hasattr(player, 'power_up_effects') else None
-                )
-                
-            # Render pause overlay
-            if self.state == GameState.PAUSED:
-                self.renderer.render_pause(painter, self.widget.size())
-                
-        elif self.state == GameState.GAME_OVER:
-            self.renderer.render_game_over(painter, self.widget.size(), self.score)
-            # Render continue prompt
-            self.hud.render_continue_prompt(painter, self.widget.size())
-        elif self.state == GameState.LEVEL_COMPLETE:
-            self.renderer.render_level_complete(painter, self.widget.size(), self.score)
-            
-        painter.end()
-        
-    def _handle_input(self):
-        """Process input for game control."""
-        # Global controls
-        if self.input.is_key_pressed('P'):
-            self.toggle_pause()
-            self.input.clear_key('P')
-            
-        if self.input.is_key_pressed('Escape'):
-            if self.state == GameState.PAUSED:
-                self.state = GameState.MENU
-                self.save_game()  # Auto-save on exit to menu
-            else:
-                self.toggle_pause()
-            self.input.clear_key('Escape')
-            
-        # Menu state controls
-        if self.state == GameState.MENU:
-            if self.input.is_key_pressed('Space') or self.input.is_key_pressed('Return'):
-                self.start_game()
-            elif self.input.is_key_pressed('L') and self.has_save:
-                self.load_game()
-                self.input.clear_key('L')
-        
-        # Game Over controls
-        elif self.state == GameState.GAME_OVER:
-            # Continue from current level
-            if self.input.is_key_pressed('Space') or self.input.is_key_pressed('Return'):
-                self.continue_game()
-                self.input.clear_key('Space')
-                self.input.clear_key('Return')
-            # Restart from level 1
-            elif self.input.is_key_pressed('R'):
-                self.start_game()
-                self.input.clear_key('R')
-
-        # Level Complete controls (Next Level)
-        elif self.state == GameState.LEVEL_COMPLETE:
-            if self.input.is_key_pressed('Space') or self.input.is_key_pressed('Return'):
-                self.next_level()
-                self.input.clear_key('Space')
-                
-    def _update_camera(self):
-        """Update camera to follow player smoothly."""
-        if not self.level_manager.player:
-            return
-            
-        player = self.level_manager.player
-        
-        # Target camera position (player centered with offset)
-        target_x = player.x - self.widget.width() / 3
-        target_y = player.y - self.widget.height() / 2
-        
-        # Smooth follow (lerp)
-        self.camera_x += (target_x - self.camera_x) * 0.1
-        self.camera_y += (target_y - self.camera_y) * 0.08
-        
-        # Clamp camera to level bounds
-        self.camera_x = max(0, self.camera_x)
-        self.camera_y = max(0, min(self.camera_y, 100))
-        
-    def _check_collisions(self):
-        """Check all game collisions."""
-        if not self.level_manager.player:
-            return
-            
-        player = self.level_manager.player
-        
-        # Coin collection
-        for coin in self.level_manager.coins[:]:
-            if self.physics.check_collision(player, coin):
-                self.level_manager.coins.remove(coin)
-                self.score += 100
-                self.total_coins += 1
-                self._play_sfx("coin")
-                
-                # Particle sparkle effect
-                self.particles.emit_coin_sparkle(
-                    coin.x + coin.width/2,
-                    coin.y + coin.height/2
-                )
-
-        # ✅ FIXED: Power-up collection (SAME AS COINS!)
-        for powerup in self.level_manager.powerups[:]:
-            if self.physics.check_collision(player, powerup):
-                print(f"💎 Power-up collision detected: {powerup.type.value}")
-                
-                # Apply effect FIRST
-                success = powerup.apply_to_player(player)
-                
-                if success:
-                    # Remove from list
-                    self.level_manager.powerups.remove(powerup)
-                    self._play_sfx("coin")  # TODO: Add specific powerup sound
-                    
-                    # Particle burst effect
-                    self.particles.emit_burst(
-                        powerup.x + powerup.width/2,
-                        powerup.y + powerup.height/2,
-                        count=15,
-                        color=powerup.properties[powerup.type]['color']
-                    )
-                    print(f"✅ Power-up collected successfully!")
-                else:
-                    print(f"⚠️ Power-up effect failed to apply")
-                
-        # Enemy collision
-        for enemy in self.level_manager.enemies[:]:
-            if self.physics.check_collision(player, enemy):
-                if player.vy > 0 and player.y < enemy.y:
-                    # Bounce on enemy
-                    if enemy.take_damage(1):
-                        # Enemy died
-                        self.level_manager.enemies.remove(enemy)
-                        self.score += 50
-                        self._play_sfx("hit")
-                        
-                        # Death explosion particles
-                        self.particles.emit_enemy_death(
-                            enemy.x + enemy.width/2,
-                            enemy.y + enemy.height/2
-                        )
-                    else:
-                        # Enemy damaged but alive
-                        self.score += 25
-                        self._play_sfx("hit")
-                        
-                    # Bounce player
-                    player.vy = -300
-                    
-                else:
-                    # Take damage
-                    player.take_damage()
-                    self._play_sfx("hit")
-                    
-                    # Damage particles
-                    self.particles.emit_damage_effect(
-                        player.x + player.width/2,
-                        player.y + player.height/2
-                    )
-                    
-        # Check spikes
-        for spike in self.level_manager.spikes:
-            if self.physics.check_collision(player, spike):
-                player.take_damage()
-                self._play_sfx("hit")
-                
-                # Damage particles
-                self.particles.emit_damage_effect(
-                    player.x + player.width/2,
-                    player.y + player.height/2
-                )
-                
-        # Check finish
-        if self.level_manager.finish:
-            if self.physics.check_collision(player, self.level_manager.finish):
-                print(f"🏁 FINISH LINE REACHED! Level {self.current_level} complete!")
-                self.state = GameState.LEVEL_COMPLETE
-                self._play_sfx("coin")  # Victory sound
-                self.sound.stop_bgm()
-                
-                # Auto-save progress
-                self.save_game()
-                
-                # Victory particles
-                self.particles.emit_burst(
-                    player.x + player.width/2,
-                    player.y + player.height/2,
-                    count=30,
-                    color=QColor(255, 215, 0)
-                )
-                
-    def _check_game_state(self):
-        """Check for game over conditions."""
-        if not self.level_manager.player:
-            return
-            
-        player = self.level_manager.player
-        
-        # Fall off world
-        if player.y > 1000:
-            player.health = 0
-            
-        # Health depleted
-        if player.health <= 0:
-            self.state = GameState.GAME_OVER
-            self._play_sfx("death")
-            self.sound.stop_bgm()
-            
-    def toggle_pause(self):
-        """Toggle pause state."""
-        if self.state == GameState.RUNNING:
-            self.state = GameState.PAUSED
-            self.sound.pause_bgm()
-        elif self.state == GameState.PAUSED:
-            self.state = GameState.RUNNING
-            self.sound.resume_bgm()
-            
-    def start_game(self):
-        """Start or restart game from Level 1."""
-        self.score = 0
-        self.total_coins = 0
-        self.current_level = "level1"
-        self.sound.reset()
-        
-        # Clear particles
-        self.particles.clear()
-        
-        # Load level
-        self.level_manager.load_level(self.current_level)
-        
-        # Initialize power-up manager
-        if self.level_manager.player:
-            self.powerup_manager = PowerUpManager(self.level_manager.player)
-            
-        self.state = GameState.RUNNING
-        self._play_bgm("run_bgm.mp3")
-        
-    def continue_game(self):
-        """Continue from current level (after game over)."""
-        # Don't reset score and coins, just reload current level
-        self.sound.reset()
-        
-        # Clear particles
-        self.particles.clear()
-        
-        # Reload current level
-        self.level_manager.load_level(self.current_level)
-        
-        # Initialize power-up manager
-        if self.level_manager.player:
-            self.powerup_manager = PowerUpManager(self.level_manager.player)
-            
-        self.state = GameState.RUNNING
-        self._play_bgm("run_bgm.mp3")
-
-    def next_level(self):
-        """Advance to the next level."""
-        try:
-            # Parse current level number and increment
-            current_num = int(self.current_level.replace("level", ""))
-            next_num = current_num + 1
-        except ValueError:
-            next_num = 1
-            
-        self.current_level = f"level{next_num}"
-        print(f"Loading {self.current_level}...")
-        
-        # Clear particles
-        self.particles.clear()
-        
-        # Load the next level
-        self.level_manager.load_level(self.current_level)
-        
-        # Re-initialize power-up manager for new player instance
-        if self.level_manager.player:
-            self.powerup_manager = PowerUpManager(self.level_manager.player)
-            
-        self.state = GameState.RUNNING
-        self._play_bgm("run_bgm.mp3")
-        
-        # Auto-save progress
-        self.save_game()
-        
-    def save_game(self):
-        """Save current game state."""
-        if not self.level_manager.player:
-            return
-            
-        save_data = {
-            "level": self.current_level,
-            "score": self.score,
-            "coins": self.total_coins,
-            "player": {
-                "x": self.level_manager.player.x,
-                "y": self.level_manager.player.y,
-                "health": self.level_manager.player.health
-            }
-        }
-        
-        if self.save_manager.save_game(save_data):
-            print(f"💾 Game saved: {self.current_level}, Score: {self.score}")
-            self.has_save = True
-        
-    def load_game(self):
-        """Load saved game state."""
-        save_data = self.save_manager.load_game()
-        
-        if not save_data:
-            print("⚠️ No save data found")
-            self.start_game()
-            return
-            
-        # Restore game state
-        self.current_level = save_data.get("level", "level1")
-        self.score = save_data.get("score", 0)
-        self.total_coins = save_data.get("coins", 0)
-        
-        print(f"📂 Loading saved game: {self.current_level}, Score: {self.score}")
-        
-        # Clear particles
-        self.particles.clear()
-        self.sound.reset()
-        
-        # Load level
-        self.level_manager.load_level(self.current_level)
-        
-        # Restore player position and health
-        if self.level_manager.player and "player" in save_data:
-            player_data = save_data["player"]
-            self.level_manager.player.x = player_data.get("x", self.level_manager.player.x)
-            self.level_manager.player.y = player_data.get("y", self.level_manager.player.y)
-            self.level_manager.player.health = player_data.get("health", 3)
-        
-        # Initialize power-up manager
-        if self.level_manager.player:
-            self.powerup_manager = PowerUpManager(self.level_manager.player)
-            
-        self.state = GameState.RUNNING
-        self._play_bgm("run_bgm.mp3")
-        
-    def on_key_press(self, event):
-        """Handle key press event."""
-        self.input.on_key_press(event)
-        
-    def on_key_release(self, event):
-        """Handle key release event."""
-        self.input.on_key_release(event)
-        
-    def on_resize(self, size: QSize):
-        """Handle window resize."""
-        self.renderer.on_resize(size)
-        
-    def shutdown(self):
-        """Cleanup and save before exit."""
-        self.timer.stop()
-        self.sound.cleanup()
-        
-        # Clear particles
-        self.particles.clear()
-        
-        # Auto-save on exit
-        if self.state == GameState.RUNNING:
-            self.save_game()
-            
-    def _play_sfx(self, name: str):
-        """Play sound effect."""
-        self.sound.play_sfx(name)
-    
-    def _play_bgm(self, track: str = "run_bgm.mp3"):
-        """Play background music."""
-        self.sound.play_bgm(track, loop=True)
+"""
+Game Engine - Main loop and game state management
+FIXED: Power-up collection logic (works like coins)
+ADDED: Save/Load system integration
+"""
+import logging
+import math
+import queue
+import threading
+from enum import IntEnum
+from PySide6.QtCore import QElapsedTimer, QTimer, QSize, Qt
+from PySide6.QtGui import QPainter, QColor
+
+from core.renderer import Renderer
+from core.physics import PhysicsEngine
+from core.input_manager import InputManager, Key
+from core.collision_kernels import aabb_sweep
+from core.spatial_hash import SpatialHashGrid
+from game.coin import Coin
+from game.level_manager import LevelManager
+from ui.hud import HUD
+from services.save_manager import SaveManager
+from run_sfx import SoundManager
+from game.particles import ParticleSystem
+from game.powerup import PowerUpManager
+
+
+# Broad-phase cell size: 2x the 48px tile size, comfortably larger than
+# any sprite so each entity lands in at most a few cells
+GRID_CELL_SIZE = 96
+
+# Collision-path diagnostics go through the logger: when debug logging
+# is off the call is a single C-level isEnabledFor check, where print
+# always formats and takes the stdout lock mid-frame
+log = logging.getLogger(__name__)
+
+# Shared read-only colors - built once instead of per event
+GOLD = QColor(255, 215, 0)
+
+# Extra world-space border around the view inside which entities still
+# animate, so they never visibly pop awake at the screen edge
+CULL_MARGIN = 128
+
+
+class GameState(IntEnum):
+    """Game state enumeration - int-valued so the per-tick state checks
+    compare at C level instead of through Enum.__eq__."""
+    MENU = 0
+    RUNNING = 1
+    PAUSED = 2
+    GAME_OVER = 3
+    LEVEL_COMPLETE = 4
+
+
+class GameEngine:
+    """Main game engine coordinating all systems."""
+    
+    def __init__(self, widget):
+        self.widget = widget
+        self.state = GameState.MENU
+
+        # Static screens (menu, pause, game over, ...) only repaint when
+        # something actually changed; tick() compares against _last_state
+        # so every transition gets exactly one repaint
+        self._dirty = True
+        self._last_state = self.state
+
+        # Target 60 FPS
+        self.target_fps = 60
+        self.frame_time = 1000 // self.target_fps  # ~16ms
+        
+        # Delta time tracking - integer nanoseconds internally, converted
+        # to float seconds once per tick at the update boundary.
+        # QElapsedTimer uses the OS monotonic clock without Python-level
+        # clock dispatch, so reading it is one cheap native call
+        self._elapsed = QElapsedTimer()
+        self._elapsed.start()
+        self.last_time_ns = self._elapsed.nsecsElapsed()
+        self.delta_time = 0.0
+        self.accumulated_time = 0.0
+
+        # Fixed-timestep physics: update always steps by fixed_dt, and a
+        # step cap keeps a long stall from spiraling into more stalls
+        self.fixed_dt = 1.0 / self.target_fps
+        self.max_steps_per_tick = 5
+        
+        # Initialize systems
+        self.renderer = Renderer(widget.size())
+        self.physics = PhysicsEngine()
+        self.input = InputManager()
+
+        # Pre-bound key ids and bit masks so _handle_input tests the
+        # input state with plain ANDs on every tick; the start mask folds
+        # the Space-or-Return pair into one test
+        self._k_p = Key.P
+        self._k_escape = Key.ESCAPE
+        self._k_space = Key.SPACE
+        self._k_return = Key.RETURN
+        self._k_l = Key.L
+        self._k_r = Key.R
+        self._m_p = 1 << Key.P
+        self._m_escape = 1 << Key.ESCAPE
+        self._m_start = 1 << Key.SPACE | 1 << Key.RETURN
+        self._m_l = 1 << Key.L
+        self._m_r = 1 << Key.R
+        self.level_manager = LevelManager(self.physics)
+        self.hud = HUD()
+        self.save_manager = SaveManager()
+
+        # Saves run on a daemon thread fed by a single-slot mailbox, so
+        # auto-save never does JSON + disk I/O on the game loop thread
+        self._save_queue = queue.Queue(maxsize=1)
+        self._save_thread = threading.Thread(
+            target=self._save_worker, daemon=True
+        )
+        self._save_thread.start()
+
+        # Sound Manager
+        self.sound = SoundManager("run_sound")
+
+        # Effects requested during a step are coalesced here, so two coin
+        # pickups in one frame trigger a single play_sfx("coin")
+        self._pending_sfx = set()
+        
+        # Particle System
+        self.particles = ParticleSystem()
+        
+        # Power-up Manager (initialized after player exists)
+        self.powerup_manager = None
+        
+        # Game state
+        self.score = 0
+        self.total_coins = 0
+        self.current_level = "level1"
+        
+        # Setup timer - PreciseTimer plus an absolute ns deadline, so the
+        # integer-ms interval truncation (16ms -> ~62.5Hz) cannot drift
+        self.timer = QTimer()
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self.tick)
+        self.frame_time_ns = 1_000_000_000 // self.target_fps
+        self.next_deadline = 0
+        
+        # Camera
+        self.camera_x = 0
+        self.camera_y = 0
+
+        # Follow smoothing as framerate-independent exponentials (0.1 /
+        # 0.08 per 60Hz step), precomputed for the fixed timestep; widget
+        # offsets are cached here and refreshed in on_resize so the
+        # camera never crosses into Qt mid-frame
+        k_x = math.log(1.0 / (1.0 - 0.1)) * 60.0
+        k_y = math.log(1.0 / (1.0 - 0.08)) * 60.0
+        self._cam_alpha_x = 1.0 - math.exp(-k_x * self.fixed_dt)
+        self._cam_alpha_y = 1.0 - math.exp(-k_y * self.fixed_dt)
+        self._max_camera_y = 100
+        size = widget.size()
+        self._w_over_3 = size.width() / 3
+        self._h_over_2 = size.height() / 2
+        self._view_w = size.width()
+        self._view_h = size.height()
+
+        # Broad-phase collision grids: static hazards (spikes + finish),
+        # semi-static collectibles (coins + powerups, rebuilt on pickup),
+        # and dynamic enemies (rebuilt every frame)
+        self.static_grid = SpatialHashGrid(GRID_CELL_SIZE)
+        self.item_grid = SpatialHashGrid(GRID_CELL_SIZE)
+        self.enemy_grid = SpatialHashGrid(GRID_CELL_SIZE)
+        
+        # Per-state dispatch tables, built once - tick/render jump
+        # straight to the right handler instead of walking if/elif
+        # chains of enum comparisons every frame
+        self._render_handlers = {
+            GameState.MENU: self._render_menu,
+            GameState.RUNNING: self._render_game,
+            GameState.PAUSED: self._render_game,
+            GameState.GAME_OVER: self._render_game_over,
+            GameState.LEVEL_COMPLETE: self._render_level_complete,
+        }
+        self._input_handlers = {
+            GameState.MENU: self._input_menu,
+            GameState.GAME_OVER: self._input_game_over,
+            GameState.LEVEL_COMPLETE: self._input_level_complete,
+        }
+
+        # Try to load saved game
+        self.has_save = self._check_save_exists()
+        
+    def _check_save_exists(self) -> bool:
+        """Check if save file exists."""
+        save_data = self.save_manager.load_game()
+        return bool(save_data)
+        
+    def start(self):
+        """Start the game engine."""
+        # Load level
+        self.level_manager.load_level(self.current_level)
+        self._rebuild_spatial_grids()
+
+        # Initialize power-up manager after player is created
+        if self.level_manager.player:
+            self.powerup_manager = PowerUpManager(self.level_manager.player)
+            
+        self.state = GameState.RUNNING
+        
+        # Play BGM automatically
+        self._play_bgm("run_bgm.mp3")
+        
+        # Start game loop
+        now_ns = self._elapsed.nsecsElapsed()
+        self.last_time_ns = now_ns
+        self.next_deadline = now_ns + self.frame_time_ns
+        self.timer.start(self.frame_time)
+        
+    def tick(self):
+        """Main game loop tick."""
+        # Re-arm the timer against the absolute deadline; any lateness in
+        # this tick shortens the next interval instead of accumulating
+        now_ns = self._elapsed.nsecsElapsed()
+        self.next_deadline += self.frame_time_ns
+        if self.next_deadline < now_ns:
+            # Missed deadlines after a stall - resync rather than firing
+            # a burst of back-to-back ticks
+            self.next_deadline = now_ns + self.frame_time_ns
+        self.timer.start(max(0, (self.next_deadline - now_ns) // 1_000_000))
+
+        # Calculate delta time from the same clock read as the deadline -
+        # integer subtraction, one float conversion
+        self.delta_time = (now_ns - self.last_time_ns) * 1e-9
+        self.last_time_ns = now_ns
+
+        # Drain queued key events, then handle input regardless of state
+        self.input.process_events()
+        self._handle_input()
+
+        # Update based on state - physics runs in fixed steps so a slow
+        # render frame produces extra steps, not bigger (tunneling) ones
+        if self.state == GameState.RUNNING:
+            self.accumulated_time += self.delta_time
+            steps = 0
+            while self.accumulated_time >= self.fixed_dt:
+                self.update(self.fixed_dt)
+                self.accumulated_time -= self.fixed_dt
+                steps += 1
+                if steps >= self.max_steps_per_tick:
+                    # Drop the backlog after a long stall instead of
+                    # trying to simulate our way out of it
+                    self.accumulated_time = 0.0
+                    break
+        else:
+            self.accumulated_time = 0.0
+
+        # Render: always while RUNNING; otherwise only when a transition
+        # (or resize/save completion) dirtied the static screen
+        state = self.state
+        if state != self._last_state:
+            self._dirty = True
+            self._last_state = state
+        if state == GameState.RUNNING or self._dirty:
+            self.widget.update()
+            self._dirty = False
+
+    def update(self, dt):
+        """Update game logic by one fixed timestep."""
+        # One player lookup per step, threaded through the helpers below
+        player = self.level_manager.player
+
+        # Update player
+        if player:
+            player.update(dt, self.input, self.sound)
+
+        # Update physics
+        self.physics.update(dt, self.level_manager)
+
+        # Camera-frustum culling: entities beyond the view (plus margin)
+        # skip animation/AI until the camera approaches - nobody sees
+        # them, and patrol AI resumes where it froze
+        view_x1 = self.camera_x - CULL_MARGIN
+        view_x2 = self.camera_x + self._view_w + CULL_MARGIN
+
+        # Update power-ups (animation only)
+        for powerup in self.level_manager.powerups:
+            if powerup.x + powerup.width >= view_x1 and powerup.x <= view_x2:
+                powerup.update(dt)
+
+        # Update power-up effects on player
+        if self.powerup_manager:
+            self.powerup_manager.update(dt)
+
+        # Update particle system
+        self.particles.update(dt)
+
+        # Update enemies
+        for enemy in self.level_manager.enemies:
+            if enemy.x + enemy.width >= view_x1 and enemy.x <= view_x2:
+                enemy.update(dt)
+            
+        # Check collisions
+        self._check_collisions(player)
+
+        # Update camera
+        self._update_camera(player)
+
+        # Check game over conditions
+        self._check_game_state(player)
+
+        # Flush coalesced sound effects once per step
+        if self._pending_sfx:
+            for name in self._pending_sfx:
+                self.sound.play_sfx(name)
+            self._pending_sfx.clear()
+
+    def render(self, event):
+        """Render game frame."""
+        # No blanket antialiasing: the background blit and tile fills are
+        # axis-aligned rects, so each handler opts in where curves and
+        # rotated shapes actually benefit
+        painter = QPainter(self.widget)
+        self._render_handlers[self.state](painter)
+        painter.end()
+
+    def _render_menu(self, painter):
+        """Render the main menu."""
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.renderer.render_menu(painter, self.widget.size(), self.has_save)
+
+    def _render_game(self, painter):
+        """Render the playfield (RUNNING and PAUSED states)."""
+        self.renderer.render_background(painter, self.camera_x)
+
+        # Render level with camera offset - entities opt in as needed,
+        # the tile blits stay aliased
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.level_manager.render(painter, self.camera_x, self.camera_y,
+                                  self._view_w, self._view_h)
+
+        # Render particles (after level, before HUD)
+        self.particles.render(painter, self.camera_x, self.camera_y,
+                              self._view_w, self._view_h)
+
+        # Render HUD
+        player = self.level_manager.player
+        if player:
+            self.hud.render(
+                painter,
+                score=self.score,
+                coins=self.total_coins,
+                health=player.health,
+                distance=int(player.x / 48),
+                level=self.current_level,
+                power_up_effects=player.power_up_effects
+            )
+
+        # Render pause overlay
+        if self.state == GameState.PAUSED:
+            self.renderer.render_pause(painter, self.widget.size())
+
+    def _render_game_over(self, painter):
+        """Render the game-over screen."""
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.renderer.render_game_over(painter, self.widget.size(), self.score)
+        # Render continue prompt
+        self.hud.render_continue_prompt(painter, self.widget.size())
+
+    def _render_level_complete(self, painter):
+        """Render the level-complete screen."""
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.renderer.render_level_complete(painter, self.widget.size(), self.score)
+        
+    def _handle_input(self):
+        """Process input for game control."""
+        # Global controls - one read of the key mask, plain AND tests.
+        # Idle frames while RUNNING (no key held at all) exit on that one
+        # test: movement keys are polled inside Player.update, and the
+        # RUNNING state has no handler below
+        keys = self.input.keys_mask
+        if keys == 0 and self.state == GameState.RUNNING:
+            return
+        if keys & self._m_p:
+            self.toggle_pause()
+            self.input.clear_key(self._k_p)
+
+        if keys & self._m_escape:
+            if self.state == GameState.PAUSED:
+                self.state = GameState.MENU
+                self.save_game()  # Auto-save on exit to menu
+            else:
+                self.toggle_pause()
+            self.input.clear_key(self._k_escape)
+
+        # State-specific controls (RUNNING/PAUSED have none)
+        handler = self._input_handlers.get(self.state)
+        if handler:
+            handler()
+
+    def _input_menu(self):
+        """Menu state controls."""
+        keys = self.input.keys_mask
+        if keys & self._m_start:
+            self.start_game()
+        elif keys & self._m_l and self.has_save:
+            self.load_game()
+            self.input.clear_key(self._k_l)
+
+    def _input_game_over(self):
+        """Game Over controls."""
+        keys = self.input.keys_mask
+        # Continue from current level
+        if keys & self._m_start:
+            self.continue_game()
+            # One combined clear instead of per-key calls
+            self.input.keys_just_pressed_mask &= ~self._m_start
+        # Restart from level 1
+        elif keys & self._m_r:
+            self.start_game()
+            self.input.clear_key(self._k_r)
+
+    def _input_level_complete(self):
+        """Level Complete controls (Next Level)."""
+        if self.input.keys_mask & self._m_start:
+            self.next_level()
+            self.input.clear_key(self._k_space)
+                
+    def _update_camera(self, player):
+        """Update camera to follow player smoothly."""
+        if not player:
+            return
+
+        # Target camera position (player centered with offset)
+        target_x = player.x - self._w_over_3
+        target_y = player.y - self._h_over_2
+
+        # Smooth follow (framerate-independent exponential lerp)
+        camera_x = self.camera_x + (target_x - self.camera_x) * self._cam_alpha_x
+        camera_y = self.camera_y + (target_y - self.camera_y) * self._cam_alpha_y
+
+        # Clamp camera to level bounds
+        self.camera_x = camera_x if camera_x > 0 else 0
+        if camera_y < 0:
+            camera_y = 0
+        elif camera_y > self._max_camera_y:
+            camera_y = self._max_camera_y
+        self.camera_y = camera_y
+        
+    @staticmethod
+    def _entity_aabb(entity):
+        """Bounding box (x1, y1, x2, y2) for a game entity."""
+        return (entity.x, entity.y,
+                entity.x + entity.width, entity.y + entity.height)
+
+    def _rebuild_spatial_grids(self):
+        """Bucket level entities for broad-phase collision queries."""
+        self.static_grid.clear()
+        for spike in self.level_manager.spikes:
+            self.static_grid.insert(spike, self._entity_aabb(spike))
+        finish = self.level_manager.finish
+        if finish:
+            self.static_grid.insert(finish, self._entity_aabb(finish))
+        self._rebuild_item_grid()
+
+    def _rebuild_item_grid(self):
+        """Rebuild the coin/powerup grid (called after pickups)."""
+        self.item_grid.clear()
+        for coin in self.level_manager.coins:
+            self.item_grid.insert(coin, self._entity_aabb(coin))
+        for powerup in self.level_manager.powerups:
+            self.item_grid.insert(powerup, self._entity_aabb(powerup))
+
+    def _check_collisions(self, player):
+        """Check all game collisions."""
+        if not player:
+            return
+
+        # Bind the hot attributes once - CPython resolves attribute
+        # chains on every use inside these loops otherwise
+        lm = self.level_manager
+        particles = self.particles
+        play_sfx = self._play_sfx
+        entity_aabb = self._entity_aabb
+
+        player_aabb = entity_aabb(player)
+        px, py = player.x, player.y
+        pw, ph = player.width, player.height
+
+        # Enemies move every frame, so their grid is rebuilt before querying
+        self.enemy_grid.clear()
+        insert = self.enemy_grid.insert
+        for enemy in lm.enemies:
+            insert(enemy, entity_aabb(enemy))
+
+        # Coin and power-up collection - only neighbors of the player
+        items_dirty = False
+        for item in aabb_sweep(px, py, pw, ph, self.item_grid.query(player_aabb)):
+            if isinstance(item, Coin):
+                item.alive = False
+                self.score += 100
+                self.total_coins += 1
+                play_sfx("coin")
+                items_dirty = True
+
+                # Particle sparkle effect
+                particles.emit_coin_sparkle(
+                    item.x + item.half_width,
+                    item.y + item.half_height
+                )
+            else:
+                powerup = item
+                log.debug("💎 Power-up collision detected: %s", powerup.type.value)
+
+                # Apply effect FIRST
+                success = powerup.apply_to_player(player)
+
+                if success:
+                    # Marked dead, compacted out below
+                    powerup.alive = False
+                    play_sfx("coin")  # TODO: Add specific powerup sound
+                    items_dirty = True
+
+                    # Particle burst effect
+                    particles.emit_burst(
+                        powerup.x + powerup.half_width,
+                        powerup.y + powerup.half_height,
+                        count=15,
+                        color=powerup.color
+                    )
+                    log.debug("✅ Power-up collected successfully!")
+                else:
+                    log.debug("⚠️ Power-up effect failed to apply")
+        if items_dirty:
+            # One compaction pass instead of an O(N) remove per pickup
+            lm.coins = [c for c in lm.coins if c.alive]
+            lm.powerups = [p for p in lm.powerups if p.alive]
+            self._rebuild_item_grid()
+
+        # Enemy collision
+        enemies_dirty = False
+        for enemy in aabb_sweep(px, py, pw, ph, self.enemy_grid.query(player_aabb)):
+            if player.vy > 0 and player.y < enemy.y:
+                # Bounce on enemy
+                if enemy.take_damage(1):
+                    # Enemy died (take_damage cleared its alive flag)
+                    enemies_dirty = True
+                    self.score += 50
+                    play_sfx("hit")
+
+                    # Death explosion particles
+                    particles.emit_enemy_death(
+                        enemy.x + enemy.half_width,
+                        enemy.y + enemy.half_height
+                    )
+                else:
+                    # Enemy damaged but alive
+                    self.score += 25
+                    play_sfx("hit")
+
+                # Bounce player
+                player.vy = -300
+
+            else:
+                # Take damage
+                player.take_damage()
+                play_sfx("hit")
+
+                # Damage particles
+                particles.emit_damage_effect(
+                    player.x + player.half_width,
+                    player.y + player.half_height
+                )
+        if enemies_dirty:
+            lm.enemies = [e for e in lm.enemies if e.alive]
+
+        # Check spikes and finish (both live in the static grid)
+        finish = lm.finish
+        for obj in aabb_sweep(px, py, pw, ph, self.static_grid.query(player_aabb)):
+            if obj is finish:
+                log.debug("🏁 FINISH LINE REACHED! Level %s complete!", self.current_level)
+                self.state = GameState.LEVEL_COMPLETE
+                play_sfx("coin")  # Victory sound
+                self.sound.stop_bgm()
+
+                # Auto-save progress
+                self.save_game()
+
+                # Victory particles
+                particles.emit_burst(
+                    player.x + player.half_width,
+                    player.y + player.half_height,
+                    count=30,
+                    color=GOLD
+                )
+            else:
+                player.take_damage()
+                play_sfx("hit")
+
+                # Damage particles
+                particles.emit_damage_effect(
+                    player.x + player.half_width,
+                    player.y + player.half_height
+                )
+                
+    def _check_game_state(self, player):
+        """Check for game over conditions."""
+        if not player:
+            return
+
+        # Fall off world
+        if player.y > 1000:
+            player.health = 0
+            
+        # Health depleted
+        if player.health <= 0:
+            self.state = GameState.GAME_OVER
+            self._play_sfx("death")
+            self.sound.stop_bgm()
+            
+    def toggle_pause(self):
+        """Toggle pause state."""
+        if self.state == GameState.RUNNING:
+            self.state = GameState.PAUSED
+            self.sound.pause_bgm()
+        elif self.state == GameState.PAUSED:
+            self.state = GameState.RUNNING
+            self.sound.resume_bgm()
+            
+    def start_game(self):
+        """Start or restart game from Level 1."""
+        self.score = 0
+        self.total_coins = 0
+        self.current_level = "level1"
+        self.sound.reset()
+        
+        # Clear particles
+        self.particles.clear()
+        
+        # Load level
+        self.level_manager.load_level(self.current_level)
+        self._rebuild_spatial_grids()
+
+        # Initialize power-up manager
+        if self.level_manager.player:
+            self.powerup_manager = PowerUpManager(self.level_manager.player)
+
+        self.state = GameState.RUNNING
+        self._play_bgm("run_bgm.mp3")
+
+    def continue_game(self):
+        """Continue from current level (after game over)."""
+        # Don't reset score and coins, just reload current level
+        self.sound.reset()
+        
+        # Clear particles
+        self.particles.clear()
+        
+        # Reload current level
+        self.level_manager.load_level(self.current_level)
+        self._rebuild_spatial_grids()
+
+        # Initialize power-up manager
+        if self.level_manager.player:
+            self.powerup_manager = PowerUpManager(self.level_manager.player)
+            
+        self.state = GameState.RUNNING
+        self._play_bgm("run_bgm.mp3")
+
+    def next_level(self):
+        """Advance to the next level."""
+        try:
+            # Parse current level number and increment
+            current_num = int(self.current_level.replace("level", ""))
+            next_num = current_num + 1
+        except ValueError:
+            next_num = 1
+            
+        self.current_level = f"level{next_num}"
+        print(f"Loading {self.current_level}...")
+        
+        # Clear particles
+        self.particles.clear()
+        
+        # Load the next level
+        self.level_manager.load_level(self.current_level)
+        self._rebuild_spatial_grids()
+
+        # Re-initialize power-up manager for new player instance
+        if self.level_manager.player:
+            self.powerup_manager = PowerUpManager(self.level_manager.player)
+            
+        self.state = GameState.RUNNING
+        self._play_bgm("run_bgm.mp3")
+        
+        # Auto-save progress
+        self.save_game()
+        
+    def _save_worker(self):
+        """Drain the save mailbox on the background thread."""
+        while True:
+            save_data = self._save_queue.get()
+            try:
+                if self.save_manager.save_game(save_data):
+                    print(f"💾 Game saved: {save_data['level']}, Score: {save_data['score']}")
+                    self.has_save = True
+                    # The menu shows a Load entry once a save exists
+                    self._dirty = True
+            finally:
+                self._save_queue.task_done()
+
+    def save_game(self):
+        """Queue the current game state for a background save."""
+        if not self.level_manager.player:
+            return
+
+        save_data = {
+            "level": self.current_level,
+            "score": self.score,
+            "coins": self.total_coins,
+            "player": {
+                "x": self.level_manager.player.x,
+                "y": self.level_manager.player.y,
+                "health": self.level_manager.player.health
+            }
+        }
+
+        # Coalesce: a newer snapshot replaces an older unwritten one
+        try:
+            self._save_queue.put_nowait(save_data)
+        except queue.Full:
+            try:
+                self._save_queue.get_nowait()
+                self._save_queue.task_done()
+            except queue.Empty:
+                pass
+            self._save_queue.put_nowait(save_data)
+        
+    def load_game(self):
+        """Load saved game state."""
+        save_data = self.save_manager.load_game()
+        
+        if not save_data:
+            print("⚠️ No save data found")
+            self.start_game()
+            return
+            
+        # Restore game state
+        self.current_level = save_data.get("level", "level1")
+        self.score = save_data.get("score", 0)
+        self.total_coins = save_data.get("coins", 0)
+        
+        print(f"📂 Loading saved game: {self.current_level}, Score: {self.score}")
+        
+        # Clear particles
+        self.particles.clear()
+        self.sound.reset()
+        
+        # Load level
+        self.level_manager.load_level(self.current_level)
+        self._rebuild_spatial_grids()
+
+        # Restore player position and health
+        if self.level_manager.player and "player" in save_data:
+            player_data = save_data["player"]
+            self.level_manager.player.x = player_data.get("x", self.level_manager.player.x)
+            self.level_manager.player.y = player_data.get("y", self.level_manager.player.y)
+            self.level_manager.player.health = player_data.get("health", 3)
+        
+        # Initialize power-up manager
+        if self.level_manager.player:
+            self.powerup_manager = PowerUpManager(self.level_manager.player)
+            
+        self.state = GameState.RUNNING
+        self._play_bgm("run_bgm.mp3")
+        
+    def on_key_press(self, event):
+        """Handle key press event."""
+        self.input.on_key_press(event)
+        
+    def on_key_release(self, event):
+        """Handle key release event."""
+        self.input.on_key_release(event)
+        
+    def on_resize(self, size: QSize):
+        """Handle window resize."""
+        self._w_over_3 = size.width() / 3
+        self._h_over_2 = size.height() / 2
+        self._view_w = size.width()
+        self._view_h = size.height()
+        self.renderer.on_resize(size)
+        self._dirty = True
+        
+    def shutdown(self):
+        """Cleanup and save before exit."""
+        self.timer.stop()
+        self.sound.cleanup()
+        
+        # Clear particles
+        self.particles.clear()
+        
+        # Auto-save on exit
+        if self.state == GameState.RUNNING:
+            self.save_game()
+
+        # Wait for any queued save to reach disk before the process exits
+        self._save_queue.join()
+            
+    def _play_sfx(self, name: str):
+        """Queue a sound effect (duplicates within a step play once)."""
+        self._pending_sfx.add(name)
+    
+    def _play_bgm(self, track: str = "run_bgm.mp3"):
+        """Play background music."""
+        self.sound.play_bgm(track, loop=True)
@@ -1,78 +1,124 @@
-"""
-Input Manager - Keyboard input handling
-Tracks key states for smooth input processing
-"""
-from PySide6.QtCore import Qt
-from typing import Dict, Set
-
-
-class InputManager:
-    """Manages keyboard input state."""
-    
-    def __init__(self):
-        self.keys_pressed: Set[str] = set()
-        self.keys_just_pressed: Set[str] = set()
-        
-        # Key mapping
-        self.key_map = {
-            Qt.Key.Key_Left: 'Left',
-            Qt.Key.Key_Right: 'Right',
-            Qt.Key.Key_Up: 'Up',
-            Qt.Key.Key_Down: 'Down',
-            Qt.Key.Key_Space: 'Space',
-            Qt.Key.Key_A: 'A',
-            Qt.Key.Key_D: 'D',
-            Qt.Key.Key_W: 'W',
-            Qt.Key.Key_S: 'S',
-            Qt.Key.Key_P: 'P',
-            Qt.Key.Key_R: 'R',  # Restart
-            Qt.Key.Key_L: 'L',  # Load
-            Qt.Key.Key_Escape: 'Escape',
-            Qt.Key.Key_Return: 'Return',
-            Qt.Key.Key_Enter: 'Return',
-        }
-        
-    def on_key_press(self, event):
-        """Handle key press event."""
-        key = event.key()
-        if key in self.key_map:
-            key_name = self.key_map[key]
-            if key_name not in self.keys_pressed:
-                self.keys_just_pressed.add(key_name)
-            self.keys_pressed.add(key_name)
-            
-    def on_key_release(self, event):
-        """Handle key release event."""
-        key = event.key()
-        if key in self.key_map:
-            key_name = self.key_map[key]
-            self.keys_pressed.discard(key_name)
-            self.keys_just_pressed.discard(key_name)
-            
-    def is_key_pressed(self, key_name: str) -> bool:
-        """Check if a key is currently pressed."""
-        return key_name in self.keys_pressed
-        
-    def is_key_just_pressed(self, key_name: str) -> bool:
-        """Check if a key was just pressed this frame."""
-        return key_name in self.keys_just_pressed
-        
-    def clear_key(self, key_name: str):
-        """Clear a key from just pressed state."""
-        self.keys_just_pressed.discard(key_name)
-        
-    def clear_all_just_pressed(self):
-        """Clear all just pressed keys (call at end of frame)."""
-        self.keys_just_pressed.clear()
-        
-    def is_move_left(self) -> bool:
-        """Check if moving left."""
-        return self.is_key_pressed('Left') or self.is_key_pressed('A')
-        
-    def is_move_right(self) -> bool:
-        """Check if moving right."""
-        return self.is_key_pressed('Right') or self.is_key_pressed('D')
-        
-    def is_jump(self) -> bool:
-        """Check if jump button is pressed."""
-        return self.is_key_just_pressed('Space') or self.is_key_just_pressed('W')
+"""
+Input Manager - Keyboard input handling
+Tracks key states for smooth input processing
+"""
+from collections import deque
+from enum import IntEnum
+from PySide6.QtCore import Qt
+
+
+class Key(IntEnum):
+    """Logical key ids - indices into the InputManager state arrays."""
+    LEFT = 0
+    RIGHT = 1
+    UP = 2
+    DOWN = 3
+    SPACE = 4
+    A = 5
+    D = 6
+    W = 7
+    S = 8
+    P = 9
+    R = 10  # Restart
+    L = 11  # Load
+    ESCAPE = 12
+    RETURN = 13
+
+
+class InputManager:
+    """Manages keyboard input state."""
+
+    def __init__(self):
+        # All key state packed into two ints, one bit per Key id -
+        # checking a key is a shift + AND, and multi-key helpers test
+        # several keys with a single mask
+        self.keys_mask = 0
+        self.keys_just_pressed_mask = 0
+
+        # Raw Qt events are queued here and applied in one drain per
+        # tick, so a burst of events (autorepeat, high-polling keyboards)
+        # costs a single tight loop instead of full work per callback
+        self._event_queue = deque(maxlen=256)
+
+        # Qt key code -> logical key id (plain ints, no enum hashing)
+        self.key_map = {
+            Qt.Key.Key_Left: Key.LEFT,
+            Qt.Key.Key_Right: Key.RIGHT,
+            Qt.Key.Key_Up: Key.UP,
+            Qt.Key.Key_Down: Key.DOWN,
+            Qt.Key.Key_Space: Key.SPACE,
+            Qt.Key.Key_A: Key.A,
+            Qt.Key.Key_D: Key.D,
+            Qt.Key.Key_W: Key.W,
+            Qt.Key.Key_S: Key.S,
+            Qt.Key.Key_P: Key.P,
+            Qt.Key.Key_R: Key.R,
+            Qt.Key.Key_L: Key.L,
+            Qt.Key.Key_Escape: Key.ESCAPE,
+            Qt.Key.Key_Return: Key.RETURN,
+            Qt.Key.Key_Enter: Key.RETURN,
+        }
+        self.key_map = {int(code): key_id for code, key_id in self.key_map.items()}
+
+        # Precombined masks bound once - the per-frame helpers do a
+        # single AND against these instead of rebuilding the shifts
+        self._left_mask = 1 << Key.LEFT | 1 << Key.A
+        self._right_mask = 1 << Key.RIGHT | 1 << Key.D
+        self._jump_mask = 1 << Key.SPACE | 1 << Key.W
+
+    def on_key_press(self, event):
+        """Queue key press event (applied by process_events)."""
+        self._event_queue.append((event.key(), True))
+
+    def on_key_release(self, event):
+        """Queue key release event (applied by process_events)."""
+        self._event_queue.append((event.key(), False))
+
+    def process_events(self):
+        """Drain queued key events into the state masks (once per tick)."""
+        queue = self._event_queue
+        key_map = self.key_map
+        pressed = self.keys_mask
+        just_pressed = self.keys_just_pressed_mask
+        while queue:
+            code, down = queue.popleft()
+            key_id = key_map.get(code)
+            if key_id is None:
+                continue
+            bit = 1 << key_id
+            if down:
+                just_pressed |= bit & ~pressed
+                pressed |= bit
+            else:
+                pressed &= ~bit
+                just_pressed &= ~bit
+        self.keys_mask = pressed
+        self.keys_just_pressed_mask = just_pressed
+
+    def is_key_pressed(self, key: int) -> bool:
+        """Check if a key is currently pressed."""
+        return bool(self.keys_mask & (1 << key))
+
+    def is_key_just_pressed(self, key: int) -> bool:
+        """Check if a key was just pressed this frame."""
+        return bool(self.keys_just_pressed_mask & (1 << key))
+
+    def clear_key(self, key: int):
+        """Clear a key from just pressed state."""
+        self.keys_just_pressed_mask &= ~(1 << key)
+
+    def clear_all_just_pressed(self):
+        """Clear all just pressed keys (call at end of frame)."""
+        self.keys_just_pressed_mask = 0
+
+    def is_move_left(self) -> bool:
+        """Check if moving left."""
+        return (self.keys_mask & self._left_mask) != 0
+
+    def is_move_right(self) -> bool:
+        """Check if moving right."""
+        return (self.keys_mask & self._right_mask) != 0
+
+    def is_jump(self) -> bool:
+        """Check if jump button is pressed."""
+        return (self.keys_just_pressed_mask & self._jump_mask) != 0
@@ -0,0 +1,69 @@
+"""
+Spatial Hash Grid - Broad-phase collision lookup
+Buckets entities by grid cell so collision queries only visit neighbors
+instead of scanning every entity in the level
+"""
+import math
+
+
+class SpatialHashGrid:
+    """Uniform grid over 2D space backed by a plain dict of cell buckets."""
+
+    def __init__(self, cell_size: float = 96.0):
+        """
+        Initialize grid.
+
+        Args:
+            cell_size: Side length of one cell; should be at least as
+                       large as the biggest sprite stored in the grid
+        """
+        self.cell_size = cell_size
+        self._buckets = {}
+
+    def clear(self):
+        """Remove all items from the grid."""
+        self._buckets.clear()
+
+    def insert(self, item, aabb):
+        """
+        Insert item into every cell its AABB touches.
+
+        Args:
+            item: Any hashable-by-identity object
+            aabb: (x1, y1, x2, y2) bounding box in world coordinates
+        """
+        x1, y1, x2, y2 = aabb
+        inv = 1.0 / self.cell_size
+        buckets = self._buckets
+        for cx in range(math.floor(x1 * inv), math.floor(x2 * inv) + 1):
+            for cy in range(math.floor(y1 * inv), math.floor(y2 * inv) + 1):
+                # Teschner's prime hash keeps the dict keys small ints
+                key = (73856093 * cx) ^ (19349663 * cy)
+                bucket = buckets.get(key)
+                if bucket is None:
+                    buckets[key] = [item]
+                else:
+                    bucket.append(item)
+
+    def query(self, aabb):
+        """
+        Yield each item whose cells overlap aabb (broad-phase only -
+        callers still run the exact AABB test on the candidates).
+
+        Args:
+            aabb: (x1, y1, x2, y2) bounding box in world coordinates
+        """
+        x1, y1, x2, y2 = aabb
+        inv = 1.0 / self.cell_size
+        buckets = self._buckets
+        seen = set()
+        for cx in range(math.floor(x1 * inv), math.floor(x2 * inv) + 1):
+            for cy in range(math.floor(y1 * inv), math.floor(y2 * inv) + 1):
+                key = (73856093 * cx) ^ (19349663 * cy)
+                bucket = buckets.get(key)
+                if bucket:
+                    for item in bucket:
+                        item_id = id(item)
+                        if item_id not in seen:
+                            seen.add(item_id)
+                            yield item
@@ -1,164 +1,209 @@
-"""
-Coin - Collectible item, Spikes, and Finish Flag
-FIXED: Finish flag collision box and visibility
-"""
-import math
-from PySide6.QtGui import QPainter, QColor, QBrush, QPen, QRadialGradient, QPolygonF
-from PySide6.QtCore import Qt, QPointF
-
-
-class Coin:
-    """Collectible coin entity."""
-    
-    def __init__(self, x: float, y: float):
-        # Position and dimensions
-        self.x = x
-        self.y = y
-        self.width = 24
-        self.height = 24
-        
-        # Animation
-        self.animation_time = 0.0
-        self.float_offset = 0.0
-        
-    def update(self, delta_time: float):
-        """Update coin animation."""
-        self.animation_time += delta_time
-        # Floating animation
-        self.float_offset = math.sin(self.animation_time * 3) * 4
-        
-    def render(self, painter: QPainter, camera_x: float, camera_y: float):
-        """Render coin sprite."""
-        screen_x = self.x - camera_x
-        screen_y = self.y - camera_y + self.float_offset
-        
-        # Skip if off-screen
-        if screen_x < -50 or screen_x > 1200:
-            return
-            
-        painter.save()
-        
-        # Rotation animation
-        rotation = math.sin(self.animation_time * 4) * 20
-        
-        center_x = screen_x + self.width / 2
-        center_y = screen_y + self.height / 2
-        
-        painter.translate(center_x, center_y)
-        painter.rotate(rotation)
-        painter.translate(-center_x, -center_y)
-        
-        # Draw coin with gradient
-        gradient = QRadialGradient(center_x, center_y, self.width / 2)
-        gradient.setColorAt(0.0, QColor(255, 223, 0))  # Bright gold
-        gradient.setColorAt(0.7, QColor(255, 215, 0))  # Gold
-        gradient.setColorAt(1.0, QColor(200, 170, 0))  # Dark gold
-        
-        painter.setBrush(QBrush(gradient))
-        painter.setPen(QPen(QColor(150, 120, 0), 2))
-        
-        # Main coin circle
-        painter.drawEllipse(screen_x + 2, screen_y + 2, self.width - 4, self.height - 4)
-        
-        # Inner circle detail
-        painter.setBrush(Qt.BrushStyle.NoBrush)
-        painter.setPen(QPen(QColor(200, 170, 0), 1))
-        painter.drawEllipse(screen_x + 6, screen_y + 6, self.width - 12, self.height - 12)
-        
-        painter.restore()
-
-
-class Spike:
-    """Hazard spike entity."""
-    
-    def __init__(self, x: float, y: float):
-        self.x = x
-        self.y = y
-        self.width = 48
-        self.height = 48
-        
-    def render(self, painter: QPainter, camera_x: float, camera_y: float):
-        """Render spike."""
-        screen_x = self.x - camera_x
-        screen_y = self.y - camera_y
-        
-        if screen_x < -100 or screen_x > 1200:
-            return
-            
-        painter.save()
-        
-        # Draw spike triangle
-        spike_color = QColor(150, 150, 150)
-        painter.setBrush(QBrush(spike_color))
-        painter.setPen(QPen(QColor(100, 100, 100), 2))
-        
-        # Triangle points
-        triangle = QPolygonF([
-            QPointF(screen_x + self.width / 2, screen_y),          # Top
-            QPointF(screen_x, screen_y + self.height),             # Bottom left
-            QPointF(screen_x + self.width, screen_y + self.height) # Bottom right
-        ])
-        
-        painter.drawPolygon(triangle)
-        
-        painter.restore()
-
-
-class Finish:
-    """Level finish flag - FIXED collision box."""
-    
-    def __init__(self, x: float, y: float):
-        self.x = x
-        self.y = y
-        # LARGER collision box for easier detection
-        self.width = 64
-        self.height = 96
-        self.animation_time = 0.0
-        
-    def update(self, delta_time: float):
-        """Update animation."""
-        self.animation_time += delta_time
-        
-    def render(self, painter: QPainter, camera_x: float, camera_y: float):
-        """Render finish flag - ALWAYS VISIBLE."""
-        screen_x = self.x - camera_x
-        screen_y = self.y - camera_y
-        
-        # DON'T skip rendering - always show finish flag!
-        # Removed off-screen culling to ensure visibility
-        
-        painter.save()
-        
-        # Flag pole (thicker for visibility)
-        painter.setBrush(QBrush(QColor(139, 69, 19)))
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawRect(screen_x + 26, screen_y, 12, self.height)
-        
-        # Flag (waving animation)
-        wave = math.sin(self.animation_time * 5) * 5
-        
-        # BRIGHT GREEN flag for visibility
-        flag_color = QColor(50, 255, 50)
-        painter.setBrush(QBrush(flag_color))
-        painter.setPen(QPen(QColor(30, 200, 30), 2))
-        
-        # Flag polygon
-        flag_shape = QPolygonF([
-            QPointF(screen_x + 38, screen_y + 15),
-            QPointF(screen_x + 78 + wave, screen_y + 35),
-            QPointF(screen_x + 38, screen_y + 55)
-        ])
-        
-        painter.drawPolygon(flag_shape)
-        
-        # Add "GOAL" text for clarity
-        painter.setPen(QColor(255, 255, 255))
-        painter.setFont(painter.font())
-        painter.drawText(int(screen_x + 5), int(screen_y + self.height + 20), "GOAL")
-        
-        # Debug: Draw collision box (optional - comment out in production)
-        # painter.setPen(QPen(QColor(255, 0, 0, 100), 2))
-        # painter.setBrush(Qt.BrushStyle.NoBrush)
-        # painter.drawRect(screen_x, screen_y, self.width, self.height)
-        
-        painter.restore()
+"""
+Coin - Collectible item, Spikes, and Finish Flag
+FIXED: Finish flag collision box and visibility
+"""
+import math
+from PySide6.QtGui import QPainter, QColor, QBrush, QPen, QPixmap, QRadialGradient, QPolygonF
+from PySide6.QtCore import Qt, QPointF
+
+
+class Coin:
+    """Collectible coin entity."""
+
+    # Pre-rendered sprite variants, one per discrete rotation step.
+    # Rasterizing gradient + ellipses per coin per frame is the single
+    # most expensive draw in coin-heavy levels; a blit of a cached
+    # pixmap is visually identical at 16 bins over the +/-20 deg swing.
+    # Built lazily on first render (needs a QGuiApplication)
+    _ROT_BINS = 16
+    _MAX_ROT = 20.0
+    _SPRITE_PAD = 4  # room for corners of the rotated coin
+    _sprite_cache = None
+
+    @classmethod
+    def _build_sprite_cache(cls):
+        """Rasterize the coin once per rotation bin."""
+        size = 24
+        pad = cls._SPRITE_PAD
+        frame = size + pad * 2
+        center = frame / 2
+        step = 2 * cls._MAX_ROT / (cls._ROT_BINS - 1)
+        cache = []
+        for i in range(cls._ROT_BINS):
+            pixmap = QPixmap(frame, frame)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.translate(center, center)
+            painter.rotate(-cls._MAX_ROT + i * step)
+            painter.translate(-center, -center)
+
+            # Same look as the old per-frame draw: gradient disc plus
+            # inner detail ring
+            gradient = QRadialGradient(center, center, size / 2)
+            gradient.setColorAt(0.0, QColor(255, 223, 0))  # Bright gold
+            gradient.setColorAt(0.7, QColor(255, 215, 0))  # Gold
+            gradient.setColorAt(1.0, QColor(200, 170, 0))  # Dark gold
+            painter.setBrush(QBrush(gradient))
+            painter.setPen(QPen(QColor(150, 120, 0), 2))
+            painter.drawEllipse(pad + 2, pad + 2, size - 4, size - 4)
+
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.setPen(QPen(QColor(200, 170, 0), 1))
+            painter.drawEllipse(pad + 6, pad + 6, size - 12, size - 12)
+            painter.end()
+            cache.append(pixmap)
+        cls._sprite_cache = cache
+
+    def __init__(self, x: float, y: float):
+        # Position and dimensions
+        self.x = x
+        self.y = y
+        self.width = 24
+        self.height = 24
+        # Half-extents, computed once so hot paths avoid the divide
+        self.half_width = self.width / 2
+        self.half_height = self.height / 2
+
+        # Animation
+        self.animation_time = 0.0
+        self.float_offset = 0.0
+
+        # Cleared on pickup; the engine compacts the coin list afterwards
+        self.alive = True
+
+    def update(self, delta_time: float):
+        """Update coin animation."""
+        self.animation_time += delta_time
+        # Floating animation
+        self.float_offset = math.sin(self.animation_time * 3) * 4
+        
+    def render(self, painter: QPainter, camera_x: float, camera_y: float,
+               view_w: int = 1200):
+        """Render coin sprite (cached pixmap, binned rotation)."""
+        screen_x = self.x - camera_x
+        screen_y = self.y - camera_y + self.float_offset
+
+        # Skip if off-screen
+        if screen_x + self.width < 0 or screen_x > view_w:
+            return
+
+        cache = Coin._sprite_cache
+        if cache is None:
+            Coin._build_sprite_cache()
+            cache = Coin._sprite_cache
+
+        # Rotation animation, snapped to the nearest pre-rendered bin
+        rotation = math.sin(self.animation_time * 4) * self._MAX_ROT
+        idx = int((rotation + self._MAX_ROT)
+                  * (self._ROT_BINS - 1) / (2 * self._MAX_ROT) + 0.5)
+        painter.drawPixmap(int(screen_x) - self._SPRITE_PAD,
+                           int(screen_y) - self._SPRITE_PAD,
+                           cache[idx])
+
+
+class Spike:
+    """Hazard spike entity."""
+
+    # The spike never animates, so one shared pre-rendered pixmap
+    # replaces the per-frame polygon rasterization (lazy-built like the
+    # coin cache)
+    _sprite = None
+
+    @classmethod
+    def _build_sprite(cls):
+        """Rasterize the spike triangle once."""
+        size = 48
+        pixmap = QPixmap(size, size)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setBrush(QBrush(QColor(150, 150, 150)))
+        painter.setPen(QPen(QColor(100, 100, 100), 2))
+        painter.drawPolygon(QPolygonF([
+            QPointF(size / 2, 0),    # Top
+            QPointF(0, size),        # Bottom left
+            QPointF(size, size)      # Bottom right
+        ]))
+        painter.end()
+        cls._sprite = pixmap
+
+    def __init__(self, x: float, y: float):
+        self.x = x
+        self.y = y
+        self.width = 48
+        self.height = 48
+
+    def render(self, painter: QPainter, camera_x: float, camera_y: float,
+               view_w: int = 1200):
+        """Render spike (cached pixmap)."""
+        screen_x = self.x - camera_x
+        screen_y = self.y - camera_y
+
+        if screen_x + self.width < 0 or screen_x > view_w:
+            return
+
+        if Spike._sprite is None:
+            Spike._build_sprite()
+        painter.drawPixmap(int(screen_x), int(screen_y), Spike._sprite)
+
+
+class Finish:
+    """Level finish flag - FIXED collision box."""
+    
+    def __init__(self, x: float, y: float):
+        self.x = x
+        self.y = y
+        # LARGER collision box for easier detection
+        self.width = 64
+        self.height = 96
+        self.animation_time = 0.0
+        
+    def update(self, delta_time: float):
+        """Update animation."""
+        self.animation_time += delta_time
+        
+    def render(self, painter: QPainter, camera_x: float, camera_y: float,
+               view_w: int = 1200):
+        """Render finish flag - ALWAYS VISIBLE."""
+        screen_x = self.x - camera_x
+        screen_y = self.y - camera_y
+        
+        # DON'T skip rendering - always show finish flag!
+        # Removed off-screen culling to ensure visibility
+        
+        painter.save()
+        
+        # Flag pole (thicker for visibility)
+        painter.setBrush(QBrush(QColor(139, 69, 19)))
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.drawRect(screen_x + 26, screen_y, 12, self.height)
+        
+        # Flag (waving animation)
+        wave = math.sin(self.animation_time * 5) * 5
+        
+        # BRIGHT GREEN flag for visibility
+        flag_color = QColor(50, 255, 50)
+        painter.setBrush(QBrush(flag_color))
+        painter.setPen(QPen(QColor(30, 200, 30), 2))
+        
+        # Flag polygon
+        flag_shape = QPolygonF([
+            QPointF(screen_x + 38, screen_y + 15),
+            QPointF(screen_x + 78 + wave, screen_y + 35),
+            QPointF(screen_x + 38, screen_y + 55)
+        ])
+        
+        painter.drawPolygon(flag_shape)
+        
+        # Add "GOAL" text for clarity
+        painter.setPen(QColor(255, 255, 255))
+        painter.setFont(painter.font())
+        painter.drawText(int(screen_x + 5), int(screen_y + self.height + 20), "GOAL")
+        
+        # Debug: Draw collision box (optional - comment out in production)
+        # painter.setPen(QPen(QColor(255, 0, 0, 100), 2))
+        # painter.setBrush(Qt.BrushStyle.NoBrush)
+        # painter.drawRect(screen_x, screen_y, self.width, self.height)
+        
+        painter.restore()
@@ -1,340 +1,374 @@
-"""
-Enemy - Enemy entities with various AI patterns
-Includes basic patrol enemy and flying enemy variants
-"""
-import math
-from PySide6.QtGui import QPainter, QColor, QBrush, QPen, QPolygonF
-from PySide6.QtCore import QRectF, Qt, QPointF
-
-
-class Enemy:
-    """Base enemy entity with patrol AI."""
-    
-    def __init__(self, x: float, y: float, patrol_range: float = 150.0):
-        """
-        Initialize enemy.
-        
-        Args:
-            x, y: Spawn position
-            patrol_range: Distance from spawn before turning around
-        """
-        # Position and dimensions
-        self.x = x
-        self.y = y
-        self.width = 32
-        self.height = 32
-        
-        # Patrol AI
-        self.spawn_x = x
-        self.spawn_y = y
-        self.patrol_range = patrol_range
-        self.move_speed = 80.0  # pixels/s
-        self.direction = 1  # 1 = right, -1 = left
-        
-        # State
-        self.health = 2
-        self.max_health = 2
-        self.animation_time = 0.0
-        self.alive = True
-        
-    def update(self, delta_time: float):
-        """
-        Update enemy AI and movement.
-        
-        Args:
-            delta_time: Time elapsed since last frame
-        """
-        if not self.alive:
-            return
-            
-        # Move in current direction
-        self.x += self.move_speed * self.direction * delta_time
-        
-        # Check patrol bounds
-        distance_from_spawn = abs(self.x - self.spawn_x)
-        if distance_from_spawn > self.patrol_range:
-            # Turn around
-            self.direction *= -1
-            
-        # Update animation
-        self.animation_time += delta_time
-        
-    def render(self, painter: QPainter, camera_x: float, camera_y: float):
-        """
-        Render enemy sprite.
-        
-        Args:
-            painter: QPainter object
-            camera_x, camera_y: Camera offset
-        """
-        if not self.alive:
-            return
-            
-        screen_x = self.x - camera_x
-        screen_y = self.y - camera_y
-        
-        # Skip if off-screen
-        if screen_x < -100 or screen_x > 1200:
-            return
-            
-        painter.save()
-        
-        # Body (spiky circle)
-        body_color = QColor(150, 50, 50)  # Dark red
-        painter.setBrush(QBrush(body_color))
-        painter.setPen(QPen(QColor(100, 30, 30), 2))
-        
-        center_x = screen_x + self.width / 2
-        center_y = screen_y + self.height / 2
-        
-        # Draw body circle
-        painter.drawEllipse(center_x - 14, center_y - 14, 28, 28)
-        
-        # Draw spikes
-        spike_color = QColor(120, 40, 40)
-        painter.setBrush(QBrush(spike_color))
-        painter.setPen(Qt.PenStyle.NoPen)
-        
-        num_spikes = 8
-        for i in range(num_spikes):
-            angle = (i / num_spikes) * 2 * math.pi + self.animation_time * 2
-            spike_x = center_x + math.cos(angle) * 12
-            spike_y = center_y + math.sin(angle) * 12
-            outer_x = center_x + math.cos(angle) * 18
-            outer_y = center_y + math.sin(angle) * 18
-            
-            # Draw spike triangle
-            spike_shape = QPolygonF([
-                QPointF(spike_x, spike_y),
-                QPointF(outer_x, outer_y),
-                QPointF(spike_x + 3, spike_y + 3)
-            ])
-            painter.drawPolygon(spike_shape)
-            
-        # Draw eyes
-        eye_color = QColor(255, 200, 0)  # Yellow
-        painter.setBrush(QBrush(eye_color))
-        
-        # Direction-based eye position
-        eye_offset = 4 if self.direction > 0 else -4
-        painter.drawEllipse(center_x + eye_offset - 3, center_y - 6, 6, 6)
-        painter.drawEllipse(center_x + eye_offset - 3, center_y + 2, 6, 6)
-        
-        painter.restore()
-        
-        # Draw health bar if damaged
-        if self.health < self.max_health:
-            self._draw_health_bar(painter, screen_x, screen_y - 10)
-            
-    def _draw_health_bar(self, painter: QPainter, x: float, y: float):
-        """Draw health bar above enemy."""
-        bar_width = 32
-        bar_height = 3
-        
-        # Background
-        painter.setBrush(QBrush(QColor(50, 50, 50)))
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawRect(int(x), int(y), bar_width, bar_height)
-        
-        # Health
-        health_ratio = self.health / self.max_health
-        health_width = bar_width * health_ratio
-        
-        health_color = QColor(255, 50, 50)
-        painter.setBrush(QBrush(health_color))
-        painter.drawRect(int(x), int(y), int(health_width), bar_height)
-        
-    def take_damage(self, amount: int = 1):
-        """
-        Take damage and check if defeated.
-        
-        Args:
-            amount: Damage amount
-            
-        Returns:
-            True if enemy died from this damage
-        """
-        self.health -= amount
-        if self.health <= 0:
-            self.alive = False
-            return True
-        return False
-
-
-class FlyingEnemy(Enemy):
-    """Enemy that flies in sine wave pattern."""
-    
-    def __init__(self, x: float, y: float, patrol_range: float = 200.0):
-        """
-        Initialize flying enemy.
-        
-        Args:
-            x, y: Spawn position
-            patrol_range: Horizontal patrol distance
-        """
-        super().__init__(x, y, patrol_range)
-        
-        # Flying-specific properties
-        self.flight_amplitude = 60.0  # Height of sine wave
-        self.wave_frequency = 2.0  # Speed of wave oscillation
-        self.move_speed = 100.0  # Slightly faster than ground enemy
-        self.width = 36
-        self.height = 28
-        
-        # Wing animation
-        self.wing_flap_speed = 12.0
-        
-    def update(self, delta_time: float):
-        """Update flying pattern with sine wave movement."""
-        if not self.alive:
-            return
-            
-        # Horizontal movement
-        self.x += self.move_speed * self.direction * delta_time
-        
-        # Sine wave vertical movement
-        self.animation_time += delta_time
-        self.y = self.spawn_y + math.sin(self.animation_time * self.wave_frequency) * self.flight_amplitude
-        
-        # Check patrol bounds (horizontal only)
-        distance_from_spawn = abs(self.x - self.spawn_x)
-        if distance_from_spawn > self.patrol_range:
-            self.direction *= -1
-            
-    def render(self, painter: QPainter, camera_x: float, camera_y: float):
-        """Render flying enemy with wings."""
-        if not self.alive:
-            return
-            
-        screen_x = self.x - camera_x
-        screen_y = self.y - camera_y
-        
-        # Skip if off-screen
-        if screen_x < -100 or screen_x > 1200:
-            return
-            
-        painter.save()
-        
-        center_x = screen_x + self.width / 2
-        center_y = screen_y + self.height / 2
-        
-        # Draw wings (animated flapping)
-        wing_angle = math.sin(self.animation_time * self.wing_flap_speed) * 25
-        wing_color = QColor(100, 100, 200, 180)
-        painter.setBrush(QBrush(wing_color))
-        painter.setPen(QPen(QColor(70, 70, 150), 2))
-        
-        # Left wing
-        painter.save()
-        painter.translate(center_x - 12, center_y)
-        painter.rotate(wing_angle)
-        painter.drawEllipse(-12, -6, 18, 12)
-        painter.restore()
-        
-        # Right wing
-        painter.save()
-        painter.translate(center_x + 12, center_y)
-        painter.rotate(-wing_angle)
-        painter.drawEllipse(-6, -6, 18, 12)
-        painter.restore()
-        
-        # Draw body (oval)
-        body_color = QColor(120, 120, 220)
-        painter.setBrush(QBrush(body_color))
-        painter.setPen(QPen(QColor(80, 80, 180), 2))
-        painter.drawEllipse(
-            center_x - 14, center_y - 10,
-            28, 20
-        )
-        
-        # Draw eyes (looking in movement direction)
-        eye_color = QColor(255, 255, 100)
-        painter.setBrush(QBrush(eye_color))
-        painter.setPen(Qt.PenStyle.NoPen)
-        
-        eye_offset = 6 if self.direction > 0 else -6
-        painter.drawEllipse(center_x + eye_offset - 3, center_y - 4, 6, 6)
-        
-        # Draw beak/nose
-        beak_color = QColor(255, 150, 50)
-        painter.setBrush(QBrush(beak_color))
-        
-        beak_tip = center_x + (12 if self.direction > 0 else -12)
-        beak_points = QPolygonF([
-            QPointF(center_x + eye_offset, center_y),
-            QPointF(beak_tip, center_y - 2),
-            QPointF(beak_tip, center_y + 2)
-        ])
-        painter.drawPolygon(beak_points)
-        
-        painter.restore()
-        
-        # Draw health bar if damaged
-        if self.health < self.max_health:
-            self._draw_health_bar(painter, screen_x, screen_y - 10)
-
-
-class SpinEnemy(Enemy):
-    """Enemy that spins in place and shoots projectiles (future expansion)."""
-    
-    def __init__(self, x: float, y: float):
-        """Initialize spin enemy."""
-        super().__init__(x, y, patrol_range=0)  # Doesn't patrol
-        
-        self.move_speed = 0  # Stationary
-        self.spin_speed = 180.0  # Degrees per second
-        self.spin_angle = 0.0
-        self.health = 3
-        self.max_health = 3
-        
-    def update(self, delta_time: float):
-        """Update spinning animation."""
-        if not self.alive:
-            return
-            
-        self.animation_time += delta_time
-        self.spin_angle += self.spin_speed * delta_time
-        
-    def render(self, painter: QPainter, camera_x: float, camera_y: float):
-        """Render spinning enemy."""
-        if not self.alive:
-            return
-            
-        screen_x = self.x - camera_x
-        screen_y = self.y - camera_y
-        
-        if screen_x < -100 or screen_x > 1200:
-            return
-            
-        painter.save()
-        
-        center_x = screen_x + self.width / 2
-        center_y = screen_y + self.height / 2
-        
-        # Rotate
-        painter.translate(center_x, center_y)
-        painter.rotate(self.spin_angle)
-        painter.translate(-center_x, -center_y)
-        
-        # Draw core
-        core_color = QColor(100, 50, 150)
-        painter.setBrush(QBrush(core_color))
-        painter.setPen(QPen(QColor(70, 30, 120), 2))
-        painter.drawEllipse(center_x - 12, center_y - 12, 24, 24)
-        
-        # Draw rotating blades
-        blade_color = QColor(150, 100, 200)
-        painter.setBrush(QBrush(blade_color))
-        
-        for i in range(4):
-            angle = (i * 90) * math.pi / 180
-            blade_x = center_x + math.cos(angle) * 18
-            blade_y = center_y + math.sin(angle) * 18
-            
-            painter.drawEllipse(blade_x - 6, blade_y - 6, 12, 12)
-            
-        painter.restore()
-        
-        # Draw health bar if damaged
-        if self.health < self.max_health:
-            self._draw_health_bar(painter, screen_x, screen_y - 10)
+"""
+Enemy - Enemy entities with various AI patterns
+Includes basic patrol enemy and flying enemy variants
+"""
+import math
+from PySide6.QtGui import QPainter, QColor, QBrush, QPen, QPolygonF, QPainterPath
+from PySide6.QtCore import QRectF, Qt, QPointF
+
+
+# Unit vectors for the 8 body spikes, used below to bake the crown path
+_NUM_SPIKES = 8
+_SPIKE_COS = tuple(math.cos(i / _NUM_SPIKES * 2 * math.pi) for i in range(_NUM_SPIKES))
+_SPIKE_SIN = tuple(math.sin(i / _NUM_SPIKES * 2 * math.pi) for i in range(_NUM_SPIKES))
+
+# All 8 spike triangles baked into one local-space path centered on the
+# origin; render positions it with the painter transform, so the whole
+# crown is a single draw call with no per-frame trig or QPolygonF builds
+_SPIKE_CROWN = QPainterPath()
+for _c, _s in zip(_SPIKE_COS, _SPIKE_SIN):
+    _SPIKE_CROWN.addPolygon(QPolygonF([
+        QPointF(_c * 12, _s * 12),
+        QPointF(_c * 18, _s * 18),
+        QPointF(_c * 12 + 3, _s * 12 + 3),
+    ]))
+del _c, _s
+
+# SpinEnemy blades sit at fixed right angles - the painter's rotate
+# supplies the spin, so the offsets are plain constants
+_BLADE_OFFSETS = ((18.0, 0.0), (0.0, 18.0), (-18.0, 0.0), (0.0, -18.0))
+
+# Pens and brushes are immutable from the renderers' point of view, so
+# they are built once at import time; per-frame construction was a
+# QColor + QBrush/QPen pair for every setBrush/setPen call
+_BODY_BRUSH = QBrush(QColor(150, 50, 50))
+_BODY_PEN = QPen(QColor(100, 30, 30), 2)
+_SPIKE_BRUSH = QBrush(QColor(120, 40, 40))
+_EYE_BRUSH = QBrush(QColor(255, 200, 0))
+_HEALTH_BG_BRUSH = QBrush(QColor(50, 50, 50))
+_HEALTH_FG_BRUSH = QBrush(QColor(255, 50, 50))
+
+_WING_BRUSH = QBrush(QColor(100, 100, 200, 180))
+_WING_PEN = QPen(QColor(70, 70, 150), 2)
+_FLY_BODY_BRUSH = QBrush(QColor(120, 120, 220))
+_FLY_BODY_PEN = QPen(QColor(80, 80, 180), 2)
+_FLY_EYE_BRUSH = QBrush(QColor(255, 255, 100))
+_BEAK_BRUSH = QBrush(QColor(255, 150, 50))
+
+_CORE_BRUSH = QBrush(QColor(100, 50, 150))
+_CORE_PEN = QPen(QColor(70, 30, 120), 2)
+_BLADE_BRUSH = QBrush(QColor(150, 100, 200))
+
+
+class Enemy:
+    """Base enemy entity with patrol AI."""
+    
+    def __init__(self, x: float, y: float, patrol_range: float = 150.0):
+        """
+        Initialize enemy.
+        
+        Args:
+            x, y: Spawn position
+            patrol_range: Distance from spawn before turning around
+        """
+        # Position and dimensions
+        self.x = x
+        self.y = y
+        self.width = 32
+        self.height = 32
+        # Half-extents, computed once so hot paths avoid the divide
+        self.half_width = self.width / 2
+        self.half_height = self.height / 2
+
+        # Patrol AI
+        self.spawn_x = x
+        self.spawn_y = y
+        self.patrol_range = patrol_range
+        self.move_speed = 80.0  # pixels/s
+        self.direction = 1  # 1 = right, -1 = left
+        
+        # State
+        self.health = 2
+        self.max_health = 2
+        self.animation_time = 0.0
+        self.alive = True
+        
+    def update(self, delta_time: float):
+        """
+        Update enemy AI and movement.
+        
+        Args:
+            delta_time: Time elapsed since last frame
+        """
+        if not self.alive:
+            return
+            
+        # Move in current direction
+        self.x += self.move_speed * self.direction * delta_time
+        
+        # Check patrol bounds
+        distance_from_spawn = abs(self.x - self.spawn_x)
+        if distance_from_spawn > self.patrol_range:
+            # Turn around
+            self.direction *= -1
+            
+        # Update animation
+        self.animation_time += delta_time
+        
+    def render(self, painter: QPainter, camera_x: float, camera_y: float,
+               view_w: int = 1200, view_h: int = 800):
+        """
+        Render enemy sprite.
+        
+        Args:
+            painter: QPainter object
+            camera_x, camera_y: Camera offset
+        """
+        if not self.alive:
+            return
+            
+        screen_x = self.x - camera_x
+        screen_y = self.y - camera_y
+        
+        # Skip if off-screen (both axes - flying variants leave the
+        # viewport vertically too)
+        if (screen_x + self.width < 0 or screen_x > view_w
+                or screen_y + self.height < 0 or screen_y > view_h):
+            return
+            
+        painter.save()
+        
+        # Body (spiky circle, dark red)
+        painter.setBrush(_BODY_BRUSH)
+        painter.setPen(_BODY_PEN)
+        
+        center_x = screen_x + self.width / 2
+        center_y = screen_y + self.height / 2
+        
+        # Draw body circle
+        painter.drawEllipse(center_x - 14, center_y - 14, 28, 28)
+        
+        # Draw spikes
+        painter.setBrush(_SPIKE_BRUSH)
+        painter.setPen(Qt.PenStyle.NoPen)
+        
+        # The painter transform supplies the spin; the crown itself is
+        # the prebuilt path, submitted in one call
+        painter.save()
+        painter.translate(center_x, center_y)
+        painter.rotate(math.degrees(self.animation_time * 2))
+        painter.drawPath(_SPIKE_CROWN)
+        painter.restore()
+
+        
+        # Draw eyes (yellow)
+        painter.setBrush(_EYE_BRUSH)
+        
+        # Direction-based eye position
+        eye_offset = 4 if self.direction > 0 else -4
+        painter.drawEllipse(center_x + eye_offset - 3, center_y - 6, 6, 6)
+        painter.drawEllipse(center_x + eye_offset - 3, center_y + 2, 6, 6)
+        
+        painter.restore()
+        
+        # Draw health bar if damaged
+        if self.health < self.max_health:
+            self._draw_health_bar(painter, screen_x, screen_y - 10)
+            
+    def _draw_health_bar(self, painter: QPainter, x: float, y: float):
+        """Draw health bar above enemy."""
+        bar_width = 32
+        bar_height = 3
+        
+        # Background
+        painter.setBrush(_HEALTH_BG_BRUSH)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.drawRect(int(x), int(y), bar_width, bar_height)
+        
+        # Health
+        health_ratio = self.health / self.max_health
+        health_width = bar_width * health_ratio
+        
+        painter.setBrush(_HEALTH_FG_BRUSH)
+        painter.drawRect(int(x), int(y), int(health_width), bar_height)
+        
+    def take_damage(self, amount: int = 1):
+        """
+        Take damage and check if defeated.
+        
+        Args:
+            amount: Damage amount
+            
+        Returns:
+            True if enemy died from this damage
+        """
+        self.health -= amount
+        if self.health <= 0:
+            self.alive = False
+            return True
+        return False
+
+
+class FlyingEnemy(Enemy):
+    """Enemy that flies in sine wave pattern."""
+    
+    def __init__(self, x: float, y: float, patrol_range: float = 200.0):
+        """
+        Initialize flying enemy.
+        
+        Args:
+            x, y: Spawn position
+            patrol_range: Horizontal patrol distance
+        """
+        super().__init__(x, y, patrol_range)
+        
+        # Flying-specific properties
+        self.flight_amplitude = 60.0  # Height of sine wave
+        self.wave_frequency = 2.0  # Speed of wave oscillation
+        self.move_speed = 100.0  # Slightly faster than ground enemy
+        self.width = 36
+        self.height = 28
+        self.half_width = self.width / 2
+        self.half_height = self.height / 2
+
+        # Wing animation
+        self.wing_flap_speed = 12.0
+        
+    def update(self, delta_time: float):
+        """Update flying pattern with sine wave movement."""
+        if not self.alive:
+            return
+            
+        # Horizontal movement
+        self.x += self.move_speed * self.direction * delta_time
+        
+        # Sine wave vertical movement
+        self.animation_time += delta_time
+        self.y = self.spawn_y + math.sin(self.animation_time * self.wave_frequency) * self.flight_amplitude
+        
+        # Check patrol bounds (horizontal only)
+        distance_from_spawn = abs(self.x - self.spawn_x)
+        if distance_from_spawn > self.patrol_range:
+            self.direction *= -1
+            
+    def render(self, painter: QPainter, camera_x: float, camera_y: float,
+               view_w: int = 1200, view_h: int = 800):
+        """Render flying enemy with wings."""
+        if not self.alive:
+            return
+            
+        screen_x = self.x - camera_x
+        screen_y = self.y - camera_y
+        
+        # Skip if off-screen
+        if (screen_x + self.width < 0 or screen_x > view_w
+                or screen_y + self.height < 0 or screen_y > view_h):
+            return
+            
+        painter.save()
+        
+        center_x = screen_x + self.width / 2
+        center_y = screen_y + self.height / 2
+        
+        # Draw wings (animated flapping)
+        wing_angle = math.sin(self.animation_time * self.wing_flap_speed) * 25
+        painter.setBrush(_WING_BRUSH)
+        painter.setPen(_WING_PEN)
+        
+        # Left wing
+        painter.save()
+        painter.translate(center_x - 12, center_y)
+        painter.rotate(wing_angle)
+        painter.drawEllipse(-12, -6, 18, 12)
+        painter.restore()
+        
+        # Right wing
+        painter.save()
+        painter.translate(center_x + 12, center_y)
+        painter.rotate(-wing_angle)
+        painter.drawEllipse(-6, -6, 18, 12)
+        painter.restore()
+        
+        # Draw body (oval)
+        painter.setBrush(_FLY_BODY_BRUSH)
+        painter.setPen(_FLY_BODY_PEN)
+        painter.drawEllipse(
+            center_x - 14, center_y - 10,
+            28, 20
+        )
+        
+        # Draw eyes (looking in movement direction)
+        painter.setBrush(_FLY_EYE_BRUSH)
+        painter.setPen(Qt.PenStyle.NoPen)
+        
+        eye_offset = 6 if self.direction > 0 else -6
+        painter.drawEllipse(center_x + eye_offset - 3, center_y - 4, 6, 6)
+        
+        # Draw beak/nose
+        painter.setBrush(_BEAK_BRUSH)
+        
+        beak_tip = center_x + (12 if self.direction > 0 else -12)
+        beak_points = QPolygonF([
+            QPointF(center_x + eye_offset, center_y),
+            QPointF(beak_tip, center_y - 2),
+            QPointF(beak_tip, center_y + 2)
+        ])
+        painter.drawPolygon(beak_points)
+        
+        painter.restore()
+        
+        # Draw health bar if damaged
+        if self.health < self.max_health:
+            self._draw_health_bar(painter, screen_x, screen_y - 10)
+
+
+class SpinEnemy(Enemy):
+    """Enemy that spins in place and shoots projectiles (future expansion)."""
+    
+    def __init__(self, x: float, y: float):
+        """Initialize spin enemy."""
+        super().__init__(x, y, patrol_range=0)  # Doesn't patrol
+        
+        self.move_speed = 0  # Stationary
+        self.spin_speed = 180.0  # Degrees per second
+        self.spin_angle = 0.0
+        self.health = 3
+        self.max_health = 3
+        
+    def update(self, delta_time: float):
+        """Update spinning animation."""
+        if not self.alive:
+            return
+            
+        self.animation_time += delta_time
+        self.spin_angle += self.spin_speed * delta_time
+        
+    def render(self, painter: QPainter, camera_x: float, camera_y: float,
+               view_w: int = 1200, view_h: int = 800):
+        """Render spinning enemy."""
+        if not self.alive:
+            return
+            
+        screen_x = self.x - camera_x
+        screen_y = self.y - camera_y
+        
+        if (screen_x + self.width < 0 or screen_x > view_w
+                or screen_y + self.height < 0 or screen_y > view_h):
+            return
+            
+        painter.save()
+        
+        center_x = screen_x + self.width / 2
+        center_y = screen_y + self.height / 2
+        
+        # Rotate
+        painter.translate(center_x, center_y)
+        painter.rotate(self.spin_angle)
+        painter.translate(-center_x, -center_y)
+        
+        # Draw core
+        painter.setBrush(_CORE_BRUSH)
+        painter.setPen(_CORE_PEN)
+        painter.drawEllipse(center_x - 12, center_y - 12, 24, 24)
+        
+        # Draw rotating blades
+        painter.setBrush(_BLADE_BRUSH)
+        
+        for dx, dy in _BLADE_OFFSETS:
+            painter.drawEllipse(center_x + dx - 6, center_y + dy - 6, 12, 12)
+            
+        painter.restore()
+        
+        # Draw health bar if damaged
+        if self.health < self.max_health:
+            self._draw_health_bar(painter, screen_x, screen_y - 10)
@@ -1,165 +1,224 @@
-"""
-Level Manager - Load levels, spawn entities, coordinate rendering
-Updated with Power-Up and Flying Enemy support
-FIXED: Finish flag detection bug
-"""
-from pathlib import Path
-from typing import List, Optional
-from PySide6.QtGui import QPainter
-
-from game.tilemap import TileMap
-from game.player import Player
-from game.enemy import Enemy, FlyingEnemy
-from game.coin import Coin, Spike, Finish
-from game.powerup import PowerUp, PowerUpType
-
-
-class LevelManager:
-    """Manages level loading and entity spawning."""
-    
-    def __init__(self, physics_engine):
-        self.physics = physics_engine
-        self.tilemap: Optional[TileMap] = None
-        self.player: Optional[Player] = None
-        self.enemies: List[Enemy] = []
-        self.coins: List[Coin] = []
-        self.spikes: List[Spike] = []
-        self.powerups: List[PowerUp] = []
-        self.finish: Optional[Finish] = None
-        
-    def load_level(self, level_name: str):
-        """Load level from file."""
-        # Clear existing entities
-        self.enemies.clear()
-        self.coins.clear()
-        self.spikes.clear()
-        self.powerups.clear()
-        self.finish = None
-        
-        # Load level file
-        level_path = Path("levels") / f"{level_name}.txt"
-        
-        # Fallback to default level if file not found
-        if not level_path.exists():
-            print(f"⚠️  Level file not found: {level_path}, using default level")
-            map_data = self._get_default_level()
-        else:
-            with open(level_path, 'r') as f:
-                map_data = f.read()
-                
-        # Create tilemap
-        self.tilemap = TileMap(tile_size=48)
-        self.tilemap.load_from_string(map_data)
-        
-        # Spawn entities from tilemap
-        self._spawn_entities()
-        
-        print(f"✓ Level loaded: {level_name}")
-        print(f"  - Enemies: {len(self.enemies)}")
-        print(f"  - Coins: {len(self.coins)}")
-        print(f"  - Power-ups: {len(self.powerups)}")
-        print(f"  - Finish flag: {'YES' if self.finish else 'NO'}")
-        
-    def _spawn_entities(self):
-        """Spawn entities based on tilemap markers."""
-        if not self.tilemap:
-            return
-            
-        tile_size = self.tilemap.tile_size
-        
-        for row in range(self.tilemap.height):
-            for col in range(self.tilemap.width):
-                tile = self.tilemap.get_tile(col, row)
-                x = col * tile_size
-                y = row * tile_size
-                
-                if tile == 'P':
-                    # Player spawn
-                    self.player = Player(x, y)
-                    
-                elif tile == 'E':
-                    # Ground enemy spawn
-                    self.enemies.append(Enemy(x, y))
-                    
-                elif tile == 'C':
-                    # Coin spawn
-                    self.coins.append(Coin(x, y))
-                    
-                elif tile == '^':
-                    # Spike spawn
-                    self.spikes.append(Spike(x, y))
-                    
-                elif tile == 'G':
-                    # Finish flag (G = Goal)
-                    self.finish = Finish(x, y)
-                    print(f"  - Finish spawned at ({x}, {y})")
-                    
-                elif tile == 'F':
-                    # Flying enemy (BUKAN finish flag)
-                    self.enemies.append(FlyingEnemy(x, y))
-                    
-                # Power-up spawns
-                elif tile == 'S':
-                    # Speed power-up
-                    self.powerups.append(PowerUp(x, y, PowerUpType.SPEED))
-                    
-                elif tile == 'H':
-                    # Health power-up
-                    self.powerups.append(PowerUp(x, y, PowerUpType.HEALTH))
-                    
-                elif tile == 'J':
-                    # Triple Jump power-up
-                    self.powerups.append(PowerUp(x, y, PowerUpType.TRIPLE_JUMP))
-                    
-                elif tile == 'D':
-                    # Shield power-up
-                    self.powerups.append(PowerUp(x, y, PowerUpType.SHIELD))
-                    
-    def render(self, painter: QPainter, camera_x: float, camera_y: float):
-        """Render all level elements."""
-        screen_width = 1024  # Default, should be passed from engine
-        
-        # Render tilemap
-        if self.tilemap:
-            self.tilemap.render(painter, camera_x, camera_y, screen_width)
-            
-        # Render spikes
-        for spike in self.spikes:
-            spike.render(painter, camera_x, camera_y)
-            
-        # Render coins
-        for coin in self.coins:
-            coin.render(painter, camera_x, camera_y)
-            
-        # Render power-ups
-        for powerup in self.powerups:
-            powerup.render(painter, camera_x, camera_y)
-            
-        # Render enemies
-        for enemy in self.enemies:
-            enemy.render(painter, camera_x, camera_y)
-            
-        # Render finish flag
-        if self.finish:
-            self.finish.render(painter, camera_x, camera_y)
-            
-        # Render player
-        if self.player:
-            self.player.render(painter, camera_x, camera_y)
-            
-    def _get_default_level(self) -> str:
-        """Return default level layout if file not found."""
-        return """
-.........................................
-.........................................
-........S.......H.......J................
-.......###.....###.....###...............
-P.........E.............................D
-########....################.........####
-........C...C...C........................
-....#################....................
-................................^........
-##############################...........
-..........................C.............G
-##############################.###########
-"""
+"""
+Level Manager - Load levels, spawn entities, coordinate rendering
+Updated with Power-Up and Flying Enemy support
+FIXED: Finish flag detection bug
+"""
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import List, Optional
+from PySide6.QtGui import QPainter
+
+from game.tilemap import TileMap
+from game.player import Player
+from game.enemy import Enemy, FlyingEnemy
+from game.coin import Coin, Spike, Finish
+from game.powerup import PowerUp, PowerUpType
+
+
+class LevelManager:
+    """Manages level loading and entity spawning."""
+    
+    def __init__(self, physics_engine):
+        self.physics = physics_engine
+        self.tilemap: Optional[TileMap] = None
+        self.player: Optional[Player] = None
+        self.enemies: List[Enemy] = []
+        self.coins: List[Coin] = []
+        self.spikes: List[Spike] = []
+        self.powerups: List[PowerUp] = []
+        self.finish: Optional[Finish] = None
+
+        # Parallel x-key arrays for the sorted entity lists; render
+        # bisects these down to the visible sub-range
+        self._coin_xs: List[float] = []
+        self._spike_xs: List[float] = []
+        self._enemy_xs: List[float] = []
+        
+    def load_level(self, level_name: str):
+        """Load level from file."""
+        # Clear existing entities
+        self.enemies.clear()
+        self.coins.clear()
+        self.spikes.clear()
+        self.powerups.clear()
+        self.finish = None
+        
+        # Load level file
+        level_path = Path("levels") / f"{level_name}.txt"
+        
+        # Fallback to default level if file not found
+        if not level_path.exists():
+            print(f"⚠️  Level file not found: {level_path}, using default level")
+            map_data = self._get_default_level()
+        else:
+            with open(level_path, 'r') as f:
+                map_data = f.read()
+                
+        # Create tilemap
+        self.tilemap = TileMap(tile_size=48)
+        self.tilemap.load_from_string(map_data)
+        
+        # Spawn entities from tilemap
+        self._spawn_entities()
+        self._sort_for_visibility()
+        
+        print(f"✓ Level loaded: {level_name}")
+        print(f"  - Enemies: {len(self.enemies)}")
+        print(f"  - Coins: {len(self.coins)}")
+        print(f"  - Power-ups: {len(self.powerups)}")
+        print(f"  - Finish flag: {'YES' if self.finish else 'NO'}")
+        
+    # Every tile character that spawns an entity; _spawn_entities only
+    # drops into per-tile Python for rows that contain at least one
+    _MARKERS = frozenset('PECG^FSHJD')
+
+    def _spawn_entities(self):
+        """Spawn entities based on tilemap markers."""
+        if not self.tilemap:
+            return
+            
+        tile_size = self.tilemap.tile_size
+        markers = self._MARKERS
+
+        # Scan the raw row lists instead of get_tile (a method call plus
+        # bounds checks per tile). Rows of plain terrain - the vast
+        # majority - are rejected with one C-level set check, and the
+        # x/y products only happen for actual markers
+        for row, row_tiles in enumerate(self.tilemap.tiles):
+            if markers.isdisjoint(row_tiles):
+                continue
+            y = row * tile_size
+            for col, tile in enumerate(row_tiles):
+                if tile not in markers:
+                    continue
+                x = col * tile_size
+                
+                if tile == 'P':
+                    # Player spawn
+                    self.player = Player(x, y)
+                    
+                elif tile == 'E':
+                    # Ground enemy spawn
+                    self.enemies.append(Enemy(x, y))
+                    
+                elif tile == 'C':
+                    # Coin spawn
+                    self.coins.append(Coin(x, y))
+                    
+                elif tile == '^':
+                    # Spike spawn
+                    self.spikes.append(Spike(x, y))
+                    
+                elif tile == 'G':
+                    # Finish flag (G = Goal)
+                    self.finish = Finish(x, y)
+                    print(f"  - Finish spawned at ({x}, {y})")
+                    
+                elif tile == 'F':
+                    # Flying enemy (BUKAN finish flag)
+                    self.enemies.append(FlyingEnemy(x, y))
+                    
+                # Power-up spawns
+                elif tile == 'S':
+                    # Speed power-up
+                    self.powerups.append(PowerUp(x, y, PowerUpType.SPEED))
+                    
+                elif tile == 'H':
+                    # Health power-up
+                    self.powerups.append(PowerUp(x, y, PowerUpType.HEALTH))
+                    
+                elif tile == 'J':
+                    # Triple Jump power-up
+                    self.powerups.append(PowerUp(x, y, PowerUpType.TRIPLE_JUMP))
+                    
+                elif tile == 'D':
+                    # Shield power-up
+                    self.powerups.append(PowerUp(x, y, PowerUpType.SHIELD))
+                    
+    # Furthest an enemy strays from its spawn_x sort key: the widest
+    # patrol range (200) plus sprite width and a turn-around overshoot
+    _ENEMY_ROAM = 300
+
+    def _sort_for_visibility(self):
+        """Sort entity lists by x and cache the parallel key arrays.
+
+        Coins and spikes never move, and enemies stay within _ENEMY_ROAM
+        of spawn_x, so render can bisect these keys for the on-screen
+        sub-range instead of visiting every entity. Pickup and death
+        compaction preserve order, so the sort survives removals; the
+        key arrays are resynced lazily on a length mismatch.
+        """
+        self.coins.sort(key=lambda c: c.x)
+        self.spikes.sort(key=lambda s: s.x)
+        self.enemies.sort(key=lambda e: e.spawn_x)
+        self._coin_xs = [c.x for c in self.coins]
+        self._spike_xs = [s.x for s in self.spikes]
+        self._enemy_xs = [e.spawn_x for e in self.enemies]
+
+    def render(self, painter: QPainter, camera_x: float, camera_y: float,
+               view_w: int = 1024, view_h: int = 768):
+        """Render all level elements within the actual viewport."""
+        # Render tilemap
+        if self.tilemap:
+            self.tilemap.render(painter, camera_x, camera_y, view_w)
+
+        view_right = camera_x + view_w
+
+        # Render spikes (visible slice only - entities left of the view
+        # sit below lo, entities right of it above hi)
+        xs = self._spike_xs
+        if len(xs) != len(self.spikes):
+            xs = self._spike_xs = [s.x for s in self.spikes]
+        lo = bisect_left(xs, camera_x - 100)
+        hi = bisect_right(xs, view_right)
+        for spike in self.spikes[lo:hi]:
+            spike.render(painter, camera_x, camera_y, view_w)
+
+        # Render coins
+        xs = self._coin_xs
+        if len(xs) != len(self.coins):
+            xs = self._coin_xs = [c.x for c in self.coins]
+        lo = bisect_left(xs, camera_x - 100)
+        hi = bisect_right(xs, view_right)
+        for coin in self.coins[lo:hi]:
+            coin.render(painter, camera_x, camera_y, view_w)
+
+        # Render power-ups
+        for powerup in self.powerups:
+            powerup.render(painter, camera_x, camera_y, view_w)
+
+        # Render enemies - keyed by spawn_x, widened by how far patrol
+        # can carry them; they also roam vertically, so their own cull
+        # takes the viewport height
+        xs = self._enemy_xs
+        if len(xs) != len(self.enemies):
+            xs = self._enemy_xs = [e.spawn_x for e in self.enemies]
+        lo = bisect_left(xs, camera_x - self._ENEMY_ROAM)
+        hi = bisect_right(xs, view_right + self._ENEMY_ROAM)
+        for enemy in self.enemies[lo:hi]:
+            enemy.render(painter, camera_x, camera_y, view_w, view_h)
+
+        # Render finish flag
+        if self.finish:
+            self.finish.render(painter, camera_x, camera_y, view_w)
+
+        # Render player
+        if self.player:
+            self.player.render(painter, camera_x, camera_y, view_w)
+            
+    def _get_default_level(self) -> str:
+        """Return default level layout if file not found."""
+        return """
+.........................................
+.........................................
+........S.......H.......J................
+.......###.....###.....###...............
+P.........E.............................D
+########....################.........####
+........C...C...C........................
+....#################....................
+................................^........
+##############################...........
+..........................C.............G
+##############################.###########
+"""
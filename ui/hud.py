@@ -8,14 +8,36 @@ from PySide6.QtCore import QRect, Qt, QRectF
 
 class HUD:
     """Manages the Heads-Up Display rendering."""
-    
+
+    # Power-up icons and colors - class-level so render never rebuilds
+    # the dict (or its QColors) per frame
+    powerup_info = {
+        'speed': {'icon': '⚡', 'color': QColor(100, 200, 255), 'name': 'SPEED'},
+        'shield': {'icon': '🛡️', 'color': QColor(200, 200, 100), 'name': 'SHIELD'},
+        'triple_jump': {'icon': '↑↑↑', 'color': QColor(200, 100, 255), 'name': 'JUMP'}
+    }
+
     def __init__(self):
         # Fonts
         self.font_large = QFont("Segoe UI", 24, QFont.Weight.Bold)
         self.font_small = QFont("Segoe UI", 16)
         self.font_bold = QFont("Segoe UI", 18, QFont.Weight.Bold)
         self.font_tiny = QFont("Segoe UI", 11, QFont.Weight.Bold)
-        
+        self.font_icon = QFont("Segoe UI", 20)
+
+        # Pens/brushes/colors built once - render() runs every frame and
+        # should only bind these, never construct them
+        self.shadow_color = QColor(0, 0, 0, 150)
+        self.gold = QColor(255, 215, 0)
+        self.white = QColor(255, 255, 255)
+        self.coin_yellow = QColor(255, 223, 0)
+        self.gray = QColor(200, 200, 200)
+        self.heart_border_pen = QPen(QColor(255, 255, 255), 2)
+        self.heart_full_brush = QBrush(QColor(255, 50, 50))
+        self.heart_empty_brush = QBrush(QColor(50, 0, 0, 100))
+        self.powerup_border_pen = QPen(QColor(255, 255, 255, 230), 2)
+        self.prompt_border_pen = QPen(QColor(255, 215, 0), 3)
+
     def render(self, painter: QPainter, score: int, coins: int, health: int, 
                distance: int, level: str = "level1", power_up_effects: dict = None):
         """
@@ -39,23 +61,23 @@ class HUD:
         
         painter.setFont(self.font_large)
         # Shadow effect
-        painter.setPen(QColor(0, 0, 0, 150))
+        painter.setPen(self.shadow_color)
         painter.drawText(QRect(2, 12, window_width, 50), Qt.AlignmentFlag.AlignCenter, level_text)
         # Main text
-        painter.setPen(QColor(255, 215, 0))  # Gold
+        painter.setPen(self.gold)
         painter.drawText(QRect(0, 10, window_width, 50), Qt.AlignmentFlag.AlignCenter, level_text)
-        
+
         # --- 2. Score & Coins (Top Left) ---
         painter.setFont(self.font_bold)
-        painter.setPen(QColor(255, 255, 255))
+        painter.setPen(self.white)
         painter.drawText(20, 40, f"SCORE: {score:05d}")
-        
-        painter.setPen(QColor(255, 223, 0))  # Coin yellow
+
+        painter.setPen(self.coin_yellow)
         painter.drawText(20, 70, f"💰 COINS: {coins}")
-        
+
         # --- 3. Distance (Top Right - Optional) ---
         painter.setFont(self.font_small)
-        painter.setPen(QColor(200, 200, 200))
+        painter.setPen(self.gray)
         painter.drawText(window_width - 150, 40, f"📍 {distance}m")
         
         # --- 4. Health Bar (Top Right) ---
@@ -74,18 +96,17 @@ class HUD:
         heart_size = 30
         gap = 10
         
+        painter.setPen(self.heart_border_pen)
+
         for i in range(3):
             x = start_x + i * (heart_size + gap)
-            
-            # Border
-            painter.setPen(QPen(QColor(255, 255, 255), 2))
-            
+
             if i < health:
                 # Full health (Red heart)
-                painter.setBrush(QBrush(QColor(255, 50, 50)))
+                painter.setBrush(self.heart_full_brush)
             else:
                 # Empty health (Dark/transparent)
-                painter.setBrush(QBrush(QColor(50, 0, 0, 100)))
+                painter.setBrush(self.heart_empty_brush)
                 
             # Draw heart shape (simplified as rounded rect)
             painter.drawRoundedRect(x, y, heart_size, heart_size, 6, 6)
@@ -103,14 +124,9 @@ class HUD:
             return
             
         painter.save()
-        
-        # Power-up icons and colors
-        powerup_info = {
-            'speed': {'icon': '⚡', 'color': QColor(100, 200, 255), 'name': 'SPEED'},
-            'shield': {'icon': '🛡️', 'color': QColor(200, 200, 100), 'name': 'SHIELD'},
-            'triple_jump': {'icon': '↑↑↑', 'color': QColor(200, 100, 255), 'name': 'JUMP'}
-        }
-        
+
+        powerup_info = self.powerup_info
+
         # Box dimensions
         box_width = 120
         box_height = 50
@@ -138,18 +154,17 @@ class HUD:
             gradient.setColorAt(1.0, bg_color)
             
             painter.setBrush(QBrush(gradient))
-            painter.setPen(QPen(QColor(255, 255, 255, 230), 2))
+            painter.setPen(self.powerup_border_pen)
             painter.drawRoundedRect(x, y, box_width, box_height, 8, 8)
-            
+
             # Icon (larger)
-            painter.setFont(QFont("Segoe UI", 20))
-            painter.setPen(QColor(255, 255, 255))
+            painter.setFont(self.font_icon)
+            painter.setPen(self.white)
             icon_rect = QRect(x, y + 5, box_width, 25)
             painter.drawText(icon_rect, Qt.AlignmentFlag.AlignCenter, info['icon'])
-            
+
             # Timer text
             painter.setFont(self.font_tiny)
-            painter.setPen(QColor(255, 255, 255))
             timer_text = f"{int(time_remaining)}s"
             timer_rect = QRect(x, y + 30, box_width, 15)
             painter.drawText(timer_rect, Qt.AlignmentFlag.AlignCenter, timer_text)
@@ -183,12 +198,12 @@ class HUD:
         gradient.setColorAt(1.0, QColor(20, 20, 20, 240))
         
         painter.setBrush(QBrush(gradient))
-        painter.setPen(QPen(QColor(255, 215, 0), 3))  # Gold border
+        painter.setPen(self.prompt_border_pen)  # Gold border
         painter.drawRoundedRect(box_x, box_y, box_width, box_height, 12, 12)
-        
+
         # Text
         painter.setFont(self.font_bold)
-        painter.setPen(QColor(255, 255, 255))
+        painter.setPen(self.white)
         
         text1 = "Press SPACE to Continue"
         text2 = "Press R to Restart from Level 1"
@@ -200,7 +215,7 @@ class HUD:
         )
         
         painter.setFont(self.font_small)
-        painter.setPen(QColor(200, 200, 200))
+        painter.setPen(self.gray)
         painter.drawText(
             QRect(box_x, box_y + 75, box_width, 30),
             Qt.AlignmentFlag.AlignCenter,